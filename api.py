@@ -8,9 +8,11 @@ from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+import heapq
 import os
 import subprocess
 from datetime import datetime
+from operator import itemgetter
 from typing import Optional
 
 from tracker import JobTracker
@@ -298,14 +300,8 @@ async def get_recent_jobs(limit: int = 10):
     
     tracker = JobTracker()
     
-    # Sort by date
-    all_jobs = sorted(
-        tracker.jobs.values(),
-        key=lambda x: x["date_found"],
-        reverse=True
-    )
-    
-    recent = all_jobs[:limit]
+    # Most recent first; only the top `limit` are needed
+    recent = heapq.nlargest(limit, tracker.jobs.values(), key=itemgetter("date_found"))
     
     return {
         "count": len(recent),
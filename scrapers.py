@@ -11,21 +11,358 @@ Uses Google Custom Search API for job discovery with:
 import os
 import re
 import json
-from datetime import datetime, timedelta
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from urllib.parse import urlsplit, urlunsplit
 from dotenv import load_dotenv
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4.dammit import UnicodeDammit
+import lxml.html
+from lxml import etree
+
+# Optional C parser for full ISO-8601 timestamps in deadlines
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+except ImportError:
+    _ciso_parse_datetime = None
 
 load_dotenv()
 
+# Per-posting progress lines (skips, detail fetches, additions) are only
+# printed when JOB_SEARCH_VERBOSE is set; summaries and errors always are
+VERBOSE = os.getenv("JOB_SEARCH_VERBOSE", "").lower() in ("1", "true", "yes")
+
+
+def _verbose(message):
+    """Print a per-posting progress line when VERBOSE is on."""
+    if VERBOSE:
+        print(message)
+
+
+# Shared HTTP session so repeated calls to the same host reuse connections.
+# Retries only use the short backoff: a server's Retry-After could otherwise
+# hold a worker thread for as long as it asks. Once retries run out the last
+# response is returned rather than raising RetryError, so callers see the
+# same status codes as without retries.
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      respect_retry_after_header=False, raise_on_status=False),
+)
+_HTTP.mount('https://', _HTTP_ADAPTER)
+_HTTP.mount('http://', _HTTP_ADAPTER)
+
+# Browser-like headers for job pages. Sent per request rather than set on the
+# session so the Google API calls keep requests' default headers.
+_DETAIL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-GB,en;q=0.9',
+}
+
 
 # ============================================================================
 # JOB DETAIL FETCHER - Scrape full details from job URLs
 # ============================================================================
 
-def fetch_job_details(url, timeout=10):
+def _first_of(path):
+    """Compile an XPath that returns only its first match in document order."""
+    return etree.XPath('(%s)[1]' % path)
+
+
+# Selectors for fetch_job_details, tried in order per field. Each is
+# (tag, test, class) for the CSS selector in the comment beside it, where
+# tag None is any element and test is 'is' (has the class), 'has' (class
+# attribute contains the text), 'under' (inside an element with the class)
+# or None (tag only).
+_DETAIL_SELECTORS = {
+    'title': (
+        ('h1', 'is', 'job-title'),                      # h1.job-title
+        ('h1', 'is', 'posting-title'),                  # h1.posting-title
+        ('h1', 'has', 'title'),                         # h1[class*="title"]
+        ('h1', 'under', 'job-title'),                   # .job-title h1
+        ('h1', 'under', 'posting-headline'),            # .posting-headline h1
+        ('h1', None, None),                             # h1
+    ),
+    'company': (
+        (None, 'is', 'company-name'),                   # .company-name
+        (None, 'is', 'employer-name'),                  # .employer-name
+        (None, 'has', 'company'),                       # [class*="company"]
+        (None, 'has', 'employer'),                      # [class*="employer"]
+        (None, 'is', 'organization'),                   # .organization
+    ),
+    'location': (
+        (None, 'is', 'location'),                       # .location
+        (None, 'has', 'location'),                      # [class*="location"]
+        (None, 'is', 'job-location'),                   # .job-location
+        (None, 'has', 'city'),                          # [class*="city"]
+        (None, 'is', 'address'),                        # .address
+    ),
+    'content': (
+        (None, 'is', 'job-description'),                # .job-description
+        (None, 'is', 'posting-description'),            # .posting-description
+        (None, 'has', 'description'),                   # [class*="description"]
+        (None, 'is', 'content'),                        # .content
+        ('article', None, None),                        # article
+        ('main', None, None),                           # main
+    ),
+}
+
+
+def _index_selectors(selectors):
+    """Group (field, position) slots by what _select_first checks on each element."""
+    index = {'is': {}, 'has': [], 'under': [], None: {}}
+    for field, field_selectors in selectors.items():
+        for position, (tag, test, name) in enumerate(field_selectors):
+            slot = (field, position)
+            if test == 'is':
+                index['is'].setdefault(name, []).append((tag, slot))
+            elif test is None:
+                index[None].setdefault(tag, []).append(slot)
+            else:
+                index[test].append((tag, name, slot))
+    return index
+
+
+_SELECTOR_INDEX = _index_selectors(_DETAIL_SELECTORS)
+# Tags that can match a selector without a class attribute of their own
+_SELECTOR_TAGS = frozenset(_SELECTOR_INDEX[None]) | {tag for tag, _, _ in _SELECTOR_INDEX['under']}
+# Class names are split on HTML whitespace, as the CSS '.name' selector does
+_CLASS_SEPARATOR_RE = re.compile(r'[ \t\n\r\f]+')
+
+# The first two headings that may introduce a requirements list, and the first
+# list after one. A heading only counts if its whole content is one string
+# (BeautifulSoup's Tag.string): every element down to it has exactly one child.
+_REQ_HEADINGS = etree.XPath(
+    "(//h2 | //h3 | //h4 | //strong | //b)"
+    "[not(descendant-or-self::*[count(node()) != 1])]"
+    "[re:test(descendant::node()[last()], 'requirement|qualification|experience|skills|criteria', 'i')]"
+    "[position() <= 2]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'},
+)
+# Lowercase forms of the heading keywords, to skip the search on pages without any
+_REQ_KEYWORDS = ('requirement', 'qualification', 'experience', 'skills', 'criteria')
+_NEXT_LIST = _first_of('descendant::*[self::ul or self::ol] | following::*[self::ul or self::ol]')
+
+# Text nodes matching BeautifulSoup's get_text(). Strings inside script, style,
+# template and ruby annotation tags belong to the innermost such tag: they are
+# left out of other elements' text and are the only text of that tag itself.
+_STRING_CONTAINERS = ('script', 'style', 'template', 'rt', 'rp')
+_IN_CONTAINER = 'ancestor::*[%s]' % ' or '.join('self::' + tag for tag in _STRING_CONTAINERS)
+_TEXT_NODES = etree.XPath('descendant::text()[not(%s)]' % _IN_CONTAINER, smart_strings=False)
+_CONTAINER_TEXT_NODES = etree.XPath(
+    'descendant::text()[%s[1][local-name() = $tag]]' % _IN_CONTAINER, smart_strings=False
+)
+
+
+# Month names in calendar order, each longest form first so 'september'
+# is tried before 'sep'. Shared with parse_deadline below.
+_MONTH_NAMES = (
+    'january|jan', 'february|feb', 'march|mar', 'april|apr', 'may', 'june|jun',
+    'july|jul', 'august|aug', 'september|sept|sep', 'october|oct',
+    'november|nov', 'december|dec',
+)
+# Full names only: the standalone page-text date patterns don't take abbreviations
+_MONTH_FULL_NAMES = tuple(names.split('|')[0] for names in _MONTH_NAMES)
+_MONTH_FULL = '(?:' + '|'.join(_MONTH_FULL_NAMES) + ')'
+_DAY = r'\d{1,2}'
+_YEAR4 = r'\d{4}'
+
+# Page-text patterns for fetch_job_details, tried in order (first match wins).
+# Each comes with keywords from which every match contains at least one, and
+# whether every match starts with one; see _first_match. Keywords must start
+# a word ('encloses' is not 'closes') and are followed by at most 10
+# separator characters.
+_DEADLINE_KEYWORDS = ('deadline', 'clos', 'apply by')
+_SALARY_RES = tuple((re.compile(p, re.IGNORECASE), keywords, leading) for p, keywords, leading in [
+    (r'£[\d,]+\s*[-–to]+\s*£[\d,]+', ('£',), False),  # £50,000 - £70,000
+    (r'£[\d,]+\s*(?:pa|per annum|per year|annually)?', ('£',), False),  # £50,000 pa
+    (r'\$[\d,]+\s*[-–to]+\s*\$[\d,]+', ('$',), False),  # $50,000 - $70,000
+    (r'salary[:\s]+£?[\d,]+', ('salary',), True),  # Salary: £50,000
+    (r'(?:stipend|funding)[:\s]+£?[\d,]+', ('stipend', 'funding'), True),  # For PhDs
+])
+_DEADLINE_RES = tuple((re.compile(p, re.IGNORECASE), keywords, leading) for p, keywords, leading in [
+    # "Deadline: 15 January 2025" or "Closing date: 15/01/2025"
+    (r'\b(?:deadline|closing date|closes?|apply by|applications?\s*close)[:\s]{1,10}(\d{1,2}[\s/-]\w+[\s/-]\d{2,4})',
+     _DEADLINE_KEYWORDS + ('application',), True),
+    (r'\b(?:deadline|closing date|closes?|apply by)[:\s]{1,10}(\w+\s+\d{1,2},?\s+\d{4})', _DEADLINE_KEYWORDS, True),
+    # Standalone dates: "15 January 2025"
+    (rf'({_DAY}\s+{_MONTH_FULL}\s+{_YEAR4})', _MONTH_FULL_NAMES, False),
+    # "January 15, 2025"
+    (rf'({_MONTH_FULL}\s+{_DAY},?\s+{_YEAR4})', _MONTH_FULL_NAMES, True),
+    # ISO format: "2025-01-15"
+    (r'\b(?:deadline|closing)[:\s]{0,10}(\d{4}-\d{2}-\d{2})', ('deadline', 'closing'), True),
+    # UK format: "15/01/2025" near deadline keywords
+    (r'\b(?:deadline|closing|apply by)[:\s]{0,10}(\d{1,2}/\d{1,2}/\d{4})', _DEADLINE_KEYWORDS, True),
+    # "Applications close on 15th January"
+    (r'\bapplications?\s+close\s+(?:on\s+)?(\d{1,2}(?:st|nd|rd|th)?\s+\w+(?:\s+\d{4})?)', ('application',), True),
+])
+# The deadline patterns led by a deadline keyword, for search snippets where a
+# bare date is as likely to be a start date as a closing date
+_KEYWORD_DEADLINE_RES = tuple(entry for entry in _DEADLINE_RES if entry[1] is not _MONTH_FULL_NAMES)
+_POST_DATE_RES = tuple((re.compile(p, re.IGNORECASE), keywords, leading) for p, keywords, leading in [
+    (r'\b(?:posted|published|listed)[:\s]{1,10}(\d{1,2}[\s/-]\w+[\s/-]\d{2,4})', ('posted', 'published', 'listed'), True),
+    (r'\b(?:posted|published)[:\s]{1,10}(\w+\s+\d{1,2},?\s+\d{4})', ('posted', 'published'), True),
+    (r'(\d+)\s*(?:days?|weeks?|months?)\s+ago', ('ago',), False),
+])
+# Every deadline and post-date pattern needs a digit
+_DIGIT_RE = re.compile(r'\d')
+_ORDINAL_RE = re.compile(r'(\d+)(?:st|nd|rd|th)')
+
+
+# Job pages are read up to the closing </body> tag or this many bytes; the
+# fields fetch_job_details looks for sit well before that on real postings
+MAX_PAGE_BYTES = 256 * 1024
+_PAGE_CHUNK_BYTES = 16 * 1024
+
+
+def _read_page(response):
+    """Raw bytes of a streamed response, stopping at </body> or MAX_PAGE_BYTES."""
+    chunks = []
+    size = 0
+    tail = b''
+    for chunk in response.iter_content(chunk_size=_PAGE_CHUNK_BYTES):
+        chunks.append(chunk)
+        size += len(chunk)
+        # Keep a few bytes of the previous chunk in case the tag is split between two
+        window = (tail + chunk).lower()
+        if size >= MAX_PAGE_BYTES or b'</body' in window:
+            break
+        tail = window[-6:]
+    return b''.join(chunks)[:MAX_PAGE_BYTES]
+
+
+def _parse_html(content, encoding=None):
+    """
+    Parse raw page bytes with lxml. Without a header charset, the encoding is
+    detected the way BeautifulSoup does it (BOM, <meta> charset, then guessing).
+    """
+    if encoding is None:
+        encoding = UnicodeDammit(content, is_html=True).original_encoding
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        # A codec Python has but libxml2 lacks (e.g. a chardet guess): decode here instead
+        content = content.decode(encoding, 'replace').encode('utf-8')
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+    return lxml.html.document_fromstring(content, parser=parser)
+
+
+def _first_match(patterns, text):
+    """
+    Match of the first pattern that matches the lowercased page text, same as
+    calling search() on each in turn. A pattern is skipped when none of its
+    keywords occur; keyword-led patterns skip the regex scan entirely, as
+    str.find locates their keywords and the pattern is only tried there.
+    """
+    for pattern, keywords, leading in patterns:
+        match = None
+        if leading:
+            for start in _keyword_starts(text, keywords):
+                match = pattern.match(text, start)
+                if match:
+                    break
+        elif any(keyword in text for keyword in keywords):
+            match = pattern.search(text)
+        if match:
+            return match
+    return None
+
+
+def _deadline_from_text(text, patterns=_DEADLINE_RES):
+    """Deadline string found in lowercased text (ordinal suffixes removed), or ''."""
+    match = _first_match(patterns, text)
+    if not match:
+        return ''
+    deadline_str = match.group(1).strip() if match.lastindex else match.group(0).strip()
+    # Clean up ordinal suffixes
+    return _ORDINAL_RE.sub(r'\1', deadline_str)
+
+
+def _keyword_starts(text, keywords):
+    """Sorted offsets in text where any of the keywords begins."""
+    starts = set()
+    for keyword in keywords:
+        start = text.find(keyword)
+        while start != -1:
+            starts.add(start)
+            start = text.find(keyword, start + 1)
+    return sorted(starts)
+
+
+def _text(elem, separator=''):
+    """Stripped, non-empty strings under elem, joined like get_text(strip=True)."""
+    if elem.tag in _STRING_CONTAINERS:
+        texts = _CONTAINER_TEXT_NODES(elem, tag=elem.tag)
+    else:
+        texts = _TEXT_NODES(elem)
+    return separator.join(stripped for stripped in (text.strip() for text in texts) if stripped)
+
+
+def _select_first(tree):
+    """
+    The first element, in document order, matching each selector in
+    _DETAIL_SELECTORS, found in one walk over the tree instead of one tree
+    search per selector. Returns {field: [element or None per selector]}.
+    """
+    index = _SELECTOR_INDEX
+    first = {field: [None] * len(selectors) for field, selectors in _DETAIL_SELECTORS.items()}
+    missing = sum(len(selectors) for selectors in _DETAIL_SELECTORS.values())
+
+    for elem in tree.iter(etree.Element):
+        tag = elem.tag
+        classes = elem.get('class')
+        if classes is None and tag not in _SELECTOR_TAGS:
+            continue
+
+        matched = []
+        matched.extend(index[None].get(tag, ()))
+        if classes is not None:
+            for name in _CLASS_SEPARATOR_RE.split(classes):
+                for selector_tag, slot in index['is'].get(name, ()):
+                    if selector_tag is None or selector_tag == tag:
+                        matched.append(slot)
+            for selector_tag, name, slot in index['has']:
+                if (selector_tag is None or selector_tag == tag) and name in classes:
+                    matched.append(slot)
+        for selector_tag, name, slot in index['under']:
+            if selector_tag == tag and first[slot[0]][slot[1]] is None and any(
+                    name in _CLASS_SEPARATOR_RE.split(ancestor.get('class') or '')
+                    for ancestor in elem.iterancestors()):
+                matched.append(slot)
+
+        for field, position in matched:
+            if first[field][position] is None:
+                first[field][position] = elem
+                missing -= 1
+        if not missing:
+            break
+    return first
+
+
+def _first_text(elements, min_length, separator=''):
+    """Text of the first selector whose first match has more than min_length characters."""
+    for elem in elements:
+        if elem is not None:
+            text = _text(elem, separator)
+            if len(text) > min_length:
+                return text
+    return ''
+
+
+def fetch_job_details(url, timeout=10, session=None):
     """
     Fetch full job details from a URL by scraping the page.
+    Requests go through the shared pooled session unless another is given.
 
     Extracts:
     - Title, Company, Location
@@ -51,120 +388,61 @@ def fetch_job_details(url, timeout=10):
     }
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-GB,en;q=0.9',
-        }
+        with (session or _HTTP).get(url, headers=_DETAIL_HEADERS, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            # Raw bytes let the parser decode once; trust the header charset only if one was sent.
+            # The bytes aren't kept, so only the tree and the text below stay in memory.
+            charset_given = 'charset' in response.headers.get('content-type', '').lower()
+            tree = _parse_html(_read_page(response), response.encoding if charset_given else None)
 
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-        text_content = soup.get_text(separator=' ', strip=True).lower()
+        # One lowercase copy of the page text: the keyword lookups in _first_match
+        # and the phrase checks below rely on it being lowercase
+        text_content = _text(tree, ' ').lower()
 
         # === TITLE ===
         # Try common title selectors
-        title_selectors = [
-            'h1.job-title', 'h1.posting-title', 'h1[class*="title"]',
-            '.job-title h1', '.posting-headline h1', 'h1'
-        ]
-        for selector in title_selectors:
-            elem = soup.select_one(selector)
-            if elem and len(elem.get_text(strip=True)) > 5:
-                details['title'] = elem.get_text(strip=True)[:200]
-                break
+        selected = _select_first(tree)
+        details['title'] = _first_text(selected['title'], 5)[:200]
 
         # === COMPANY ===
-        company_selectors = [
-            '.company-name', '.employer-name', '[class*="company"]',
-            '[class*="employer"]', '.organization'
-        ]
-        for selector in company_selectors:
-            elem = soup.select_one(selector)
-            if elem and len(elem.get_text(strip=True)) > 1:
-                details['company'] = elem.get_text(strip=True)[:100]
-                break
+        details['company'] = _first_text(selected['company'], 1)[:100]
 
         # === LOCATION ===
-        location_selectors = [
-            '.location', '[class*="location"]', '.job-location',
-            '[class*="city"]', '.address'
-        ]
-        for selector in location_selectors:
-            elem = soup.select_one(selector)
-            if elem and len(elem.get_text(strip=True)) > 1:
-                location_text = elem.get_text(strip=True)[:100]
-                details['location'] = location_text
-                # Try to extract city
-                if ',' in location_text:
-                    details['city'] = location_text.split(',')[0].strip()
-                break
+        location_text = _first_text(selected['location'], 1)[:100]
+        details['location'] = location_text
+        # Try to extract city
+        if ',' in location_text:
+            details['city'] = location_text.split(',')[0].strip()
 
         # === SALARY ===
-        salary_patterns = [
-            r'£[\d,]+\s*[-–to]+\s*£[\d,]+',  # £50,000 - £70,000
-            r'£[\d,]+\s*(?:pa|per annum|per year|annually)?',  # £50,000 pa
-            r'\$[\d,]+\s*[-–to]+\s*\$[\d,]+',  # $50,000 - $70,000
-            r'salary[:\s]+£?[\d,]+',  # Salary: £50,000
-            r'(?:stipend|funding)[:\s]+£?[\d,]+',  # For PhDs
-        ]
-        for pattern in salary_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
-            if match:
-                details['salary'] = match.group(0).strip()
-                break
+        match = _first_match(_SALARY_RES, text_content)
+        if match:
+            details['salary'] = match.group(0).strip()
+
+        # Dates need digits; skip both scans on pages without any
+        has_digit = _DIGIT_RE.search(text_content) is not None
 
         # === DEADLINE ===
-        # More comprehensive deadline patterns
-        deadline_patterns = [
-            # "Deadline: 15 January 2025" or "Closing date: 15/01/2025"
-            r'(?:deadline|closing date|closes?|apply by|applications?\s*close)[:\s]+(\d{1,2}[\s/-]\w+[\s/-]\d{2,4})',
-            r'(?:deadline|closing date|closes?|apply by)[:\s]+(\w+\s+\d{1,2},?\s+\d{4})',
-            # Standalone dates: "15 January 2025"
-            r'(\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4})',
-            # "January 15, 2025"
-            r'((?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4})',
-            # ISO format: "2025-01-15"
-            r'(?:deadline|closing)[:\s]*(\d{4}-\d{2}-\d{2})',
-            # UK format: "15/01/2025" near deadline keywords
-            r'(?:deadline|closing|apply by)[:\s]*(\d{1,2}/\d{1,2}/\d{4})',
-            # "Applications close on 15th January"
-            r'applications?\s+close\s+(?:on\s+)?(\d{1,2}(?:st|nd|rd|th)?\s+\w+(?:\s+\d{4})?)',
-        ]
-        for pattern in deadline_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
-            if match:
-                deadline_str = match.group(1).strip() if match.lastindex else match.group(0).strip()
-                # Clean up ordinal suffixes
-                deadline_str = re.sub(r'(\d+)(?:st|nd|rd|th)', r'\1', deadline_str)
-                details['deadline'] = deadline_str
-                break
+        deadline_str = has_digit and _deadline_from_text(text_content)
+        if deadline_str:
+            details['deadline'] = deadline_str
 
         # === POST DATE (to detect old jobs) ===
-        post_date_patterns = [
-            r'(?:posted|published|listed)[:\s]+(\d{1,2}[\s/-]\w+[\s/-]\d{2,4})',
-            r'(?:posted|published)[:\s]+(\w+\s+\d{1,2},?\s+\d{4})',
-            r'(\d+)\s*(?:days?|weeks?|months?)\s+ago',
-        ]
-        for pattern in post_date_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
-            if match:
-                details['post_date'] = match.group(0).strip()
-                break
+        match = has_digit and _first_match(_POST_DATE_RES, text_content)
+        if match:
+            details['post_date'] = match.group(0).strip()
 
         # === REQUIREMENTS ===
         # Look for requirement sections
         requirements = []
-        req_headers = soup.find_all(['h2', 'h3', 'h4', 'strong', 'b'],
-                                     string=re.compile(r'requirement|qualification|experience|skills|criteria', re.I))
-        for header in req_headers[:2]:  # Limit to first 2 sections
-            # Get the next sibling list or paragraphs
-            next_elem = header.find_next(['ul', 'ol'])
-            if next_elem:
-                items = next_elem.find_all('li')[:8]  # Limit items
+        has_req_keyword = any(keyword in text_content for keyword in _REQ_KEYWORDS)
+        for header in (_REQ_HEADINGS(tree) if has_req_keyword else ()):  # Limit to first 2 sections
+            # Get the next list in the document
+            found = _NEXT_LIST(header)
+            if found:
+                items = list(found[0].iter('li'))[:8]  # Limit items
                 for item in items:
-                    text = item.get_text(strip=True)
+                    text = _text(item)
                     if 5 < len(text) < 200:
                         requirements.append(text)
 
@@ -173,17 +451,9 @@ def fetch_job_details(url, timeout=10):
 
         # === DESCRIPTION ===
         # Get main content area
-        content_selectors = [
-            '.job-description', '.posting-description', '[class*="description"]',
-            '.content', 'article', 'main'
-        ]
-        for selector in content_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                desc = elem.get_text(separator=' ', strip=True)
-                if len(desc) > 100:
-                    details['description'] = desc[:2000]
-                    break
+        desc = _first_text(selected['content'], 100, ' ')
+        if desc:
+            details['description'] = desc[:2000]
 
         # === CV/COVER LETTER ===
         if any(phrase in text_content for phrase in ['cv required', 'resume required', 'upload cv', 'attach cv']):
@@ -192,7 +462,8 @@ def fetch_job_details(url, timeout=10):
             details['cover_letter_required'] = 'Yes'
 
     except requests.RequestException as e:
-        # Silently fail - we'll use what we have from Google
+        # Silently fail - we'll use what we have from Google (this includes
+        # requests.exceptions.RetryError)
         pass
     except Exception as e:
         # Silently fail for parsing errors
@@ -200,48 +471,197 @@ def fetch_job_details(url, timeout=10):
 
     return details
 
-# Cache file for intermediate results (allows resuming after crashes)
-CACHE_FILE = "job_search_cache.json"
 
+# Scraped details are also kept on disk for this many hours (0 turns it off),
+# one file per URL, so postings seen in an earlier run aren't fetched again
+DETAILS_CACHE_DIR = os.path.join("data", "details_cache")
+DETAILS_CACHE_HOURS = float(os.getenv("DETAILS_CACHE_HOURS", "24"))
 
-def save_cache(jobs, search_type="industry"):
-    """Save intermediate results to cache file for crash recovery."""
+
+def _details_cache_path(url):
+    """
+    File holding the cached details for url. Keyed on the canonical URL, so a
+    posting reached through a different tracking link finds the same entry.
+    """
+    key = _canonical_url(url)
+    return os.path.join(DETAILS_CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+
+def _details_cache_get(url):
+    """Cached details for url if they are fresh enough, else None."""
+    if DETAILS_CACHE_HOURS <= 0:
+        return None
+    path = _details_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > DETAILS_CACHE_HOURS * 3600:
+            # Stale: drop it now rather than leave it for the sweep
+            os.remove(path)
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Missing or unreadable: fetch the page instead
+        return None
+
+
+_details_cache_swept = threading.Event()
+
+
+def _sweep_details_cache():
+    """Delete cached details older than DETAILS_CACHE_HOURS (and stray temp files)."""
+    cutoff = time.time() - DETAILS_CACHE_HOURS * 3600
+    try:
+        with os.scandir(DETAILS_CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        # No cache directory yet
+        pass
+
+
+def _details_cache_put(url, details):
+    """Store details for url, swapping the file in so readers never see half of it."""
+    if DETAILS_CACHE_HOURS <= 0:
+        return
+    # Sweep out expired entries once per process, so the directory doesn't
+    # keep every posting ever fetched
+    if not _details_cache_swept.is_set():
+        _details_cache_swept.set()
+        _sweep_details_cache()
+    try:
+        os.makedirs(DETAILS_CACHE_DIR, exist_ok=True)
+        path = _details_cache_path(url)
+        tmp_file = path + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(details, f, separators=(',', ':'))
+        os.replace(tmp_file, path)
+    except Exception as e:
+        print(f"   ⚠️  Could not cache details: {e}")
+
+
+@lru_cache(maxsize=512)
+def _fetch_job_details_cached(url):
+    """
+    fetch_job_details, memoized per URL so repeat results aren't re-scraped,
+    and backed by the on-disk cache across runs.
+    """
+    details = _details_cache_get(url)
+    if details is None:
+        details = fetch_job_details(url)
+        # A failed fetch comes back with nothing filled in; don't keep that
+        if details['title'] or details['description']:
+            _details_cache_put(url, details)
+    return details
+
+
+def _job_details(url):
+    """Details for url from the memo, copied so callers never share its lists."""
+    return {key: list(value) if isinstance(value, list) else value
+            for key, value in _fetch_job_details_cached(url).items()}
+
+
+DETAIL_FETCH_WORKERS = 16
+DETAIL_FETCHES_PER_HOST = 4
+
+
+def _run_per_host(function, urls, max_workers):
+    """
+    Call function(url) for each distinct URL on a thread pool, with at most
+    DETAIL_FETCHES_PER_HOST calls to one host at a time.
+    Returns {url: result} in the order the URLs were given.
+    """
+    urls = list(dict.fromkeys(urls))
+    host_slots = {}
+    for url in urls:
+        host = urlsplit(url).hostname
+        if host not in host_slots:
+            host_slots[host] = threading.BoundedSemaphore(DETAIL_FETCHES_PER_HOST)
+
+    def call(url):
+        with host_slots[urlsplit(url).hostname]:
+            return function(url)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(urls, executor.map(call, urls)))
+
+
+def _prefetch_job_details(urls):
+    """Fill the detail memo for urls concurrently, so the _job_details calls that follow are lookups."""
+    urls = [url for url in urls if url]
+    if len(urls) > 1:
+        _run_per_host(_fetch_job_details_cached, urls, DETAIL_FETCH_WORKERS)
+
+# Cache files for intermediate results (allows resuming after crashes): one
+# job per line, appended as results arrive, plus a small header file
+CACHE_FILE = "job_search_cache.jsonl"
+CACHE_META_FILE = "job_search_cache.meta.json"
+
+
+def _write_cache_meta(search_type):
+    """Record when and for which search the cache was started."""
+    with open(CACHE_META_FILE, 'w') as f:
+        json.dump({"timestamp": datetime.now().isoformat(), "search_type": search_type}, f)
+
+
+def start_cache(search_type="industry"):
+    """Start an empty cache for a new run, replacing any previous one."""
+    try:
+        _write_cache_meta(search_type)
+        open(CACHE_FILE, 'w').close()
+    except Exception as e:
+        print(f"   ⚠️  Could not start cache: {e}")
+
+
+def append_cache(job):
+    """Add one job to the cache; only that job is serialised."""
     try:
-        cache_data = {
-            "timestamp": datetime.now().isoformat(),
-            "search_type": search_type,
-            "job_count": len(jobs),
-            "jobs": jobs
-        }
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f, indent=2, default=str)
-        print(f"   💾 Cached {len(jobs)} jobs for crash recovery")
+        with open(CACHE_FILE, 'a') as f:
+            f.write(json.dumps(job, separators=(',', ':'), default=str) + '\n')
     except Exception as e:
-        print(f"   ⚠️  Could not save cache: {e}")
+        print(f"   ⚠️  Could not append to cache: {e}")
+
+
+def save_cache(jobs, search_type="industry"):
+    """Save a whole result list to the cache, as _stream_search does one job at a time."""
+    start_cache(search_type)
+    for job in jobs:
+        append_cache(job)
+    print(f"   💾 Cached {len(jobs)} jobs for crash recovery")
 
 
 def load_cache(search_type="industry", max_age_hours=2):
     """Load cached results if available and recent enough."""
     try:
-        if not os.path.exists(CACHE_FILE):
+        if not (os.path.exists(CACHE_META_FILE) and os.path.exists(CACHE_FILE)):
             return None
 
-        with open(CACHE_FILE, 'r') as f:
-            cache_data = json.load(f)
+        with open(CACHE_META_FILE, 'r') as f:
+            cache_meta = json.load(f)
 
         # Check if cache is for the right search type
-        if cache_data.get("search_type") != search_type:
+        if cache_meta.get("search_type") != search_type:
             return None
 
         # Check if cache is recent enough
-        cache_time = datetime.fromisoformat(cache_data.get("timestamp", "2000-01-01"))
+        cache_time = datetime.fromisoformat(cache_meta.get("timestamp", "2000-01-01"))
         age_hours = (datetime.now() - cache_time).total_seconds() / 3600
 
         if age_hours > max_age_hours:
             print(f"   ⏰ Cache is {age_hours:.1f} hours old (max: {max_age_hours}h) - refreshing")
             return None
 
-        jobs = cache_data.get("jobs", [])
+        jobs = []
+        with open(CACHE_FILE, 'r') as f:
+            for line in f:
+                try:
+                    jobs.append(json.loads(line))
+                except ValueError:
+                    # A crash mid-append leaves a partial last line
+                    break
         print(f"   ✅ Loaded {len(jobs)} jobs from cache ({age_hours:.1f}h old)")
         return jobs
     except Exception as e:
@@ -250,131 +670,204 @@ def load_cache(search_type="industry", max_age_hours=2):
 
 
 def clear_cache():
-    """Clear the cache file."""
-    try:
-        if os.path.exists(CACHE_FILE):
-            os.remove(CACHE_FILE)
-    except Exception:
-        pass
+    """Clear the cache files."""
+    for path in (CACHE_FILE, CACHE_META_FILE):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception:
+            pass
 
 
 # ============================================================================
 # DEADLINE VALIDATION - Filter out expired opportunities
 # ============================================================================
 
-def parse_deadline(deadline_text):
+# Ambiguous numeric dates like "01/02/2025" are read as DD/MM (UK) when True,
+# MM/DD (US) when False. Unambiguous dates ("12/31/2024") parse either way.
+LOCALE_DMY = True
+
+# Returned by parse_deadline when nothing parses; check with `is`
+DEADLINE_UNKNOWN = date.min
+
+# Placeholder deadline values meaning "no deadline given" (compared after strip())
+_NO_DEADLINE = frozenset(['Not specified', 'Not Specified', 'not specified', '', 'N/A', 'n/a'])
+
+_RE_NUMERIC = re.compile(r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})')
+_RE_ISO = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# One capture group per month in calendar order, so the position of the
+# group that matched is the month number (see _matched_month)
+_MONTH_GROUPS = '(?:' + '|'.join('(' + names + ')' for names in _MONTH_NAMES) + ')'
+
+# All month-name forms in one scan: "31 December 2024" / "31 Dec" use groups
+# 1-14 (year optional), "December 31, 2024" uses groups 15-28
+_RE_MONTH_DATE = re.compile(
+    r'(\d{1,2})\s+' + _MONTH_GROUPS + r'(?:\s+(\d{4}))?'
+    r'|' + _MONTH_GROUPS + r'\s+(\d{1,2}),?\s+(\d{4})'
+)
+
+
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _mkdate(year, month, day, _days_in_month=_DAYS_IN_MONTH, _unknown=DEADLINE_UNKNOWN, _date=date):
     """
-    Parse a deadline string into a datetime object.
-    Returns None if parsing fails.
+    Build a date, returning DEADLINE_UNKNOWN instead of raising if invalid.
+    Constants are bound as defaults so the fast path reads locals, not globals.
     """
-    if not deadline_text or deadline_text in ['Not specified', 'Not Specified', '', 'N/A']:
-        return None
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= _days_in_month[month]):
+        return _unknown
+    if month == 2 and day == 29 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        return _unknown
+    return _date(year, month, day)
 
-    original_text = deadline_text.strip()
-    deadline_lower = deadline_text.lower().strip()
-
-    # Month name mappings for manual parsing
-    month_map = {
-        'january': 1, 'jan': 1,
-        'february': 2, 'feb': 2,
-        'march': 3, 'mar': 3,
-        'april': 4, 'apr': 4,
-        'may': 5,
-        'june': 6, 'jun': 6,
-        'july': 7, 'jul': 7,
-        'august': 8, 'aug': 8,
-        'september': 9, 'sep': 9, 'sept': 9,
-        'october': 10, 'oct': 10,
-        'november': 11, 'nov': 11,
-        'december': 12, 'dec': 12,
-    }
 
-    # Pattern 1: "31 December 2024" or "31 Dec 2024"
-    match = re.search(r'(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\s+(\d{4})', deadline_lower)
-    if match:
-        day = int(match.group(1))
-        month = month_map.get(match.group(2), 1)
-        year = int(match.group(3))
+def _day_month(a, b):
+    """Order two numeric date parts as (day, month) - see LOCALE_DMY."""
+    # A value above 12 can only be the day; otherwise fall back to the locale
+    if a > 12:
+        return a, b
+    if b > 12:
+        return b, a
+    return (a, b) if LOCALE_DMY else (b, a)
+
+
+def _matched_month(match, first_group):
+    """Return the month number from the _MONTH_GROUPS starting at first_group."""
+    groups = match.groups()[first_group - 1:first_group + 11]
+    for month, name in enumerate(groups, 1):
+        if name:
+            return month
+
+
+def parse_deadline(deadline_text, today=None):
+    """
+    Parse a deadline string into a date object.
+    Returns DEADLINE_UNKNOWN if parsing fails.
+
+    `today` is used to resolve dates without a year; pass it in to pin the
+    same reference day across a batch.
+    """
+    if not deadline_text or deadline_text.strip() in _NO_DEADLINE:
+        return DEADLINE_UNKNOWN
+
+    # Keyed on the reference day too, since yearless dates depend on it
+    return _parse_deadline_cached(deadline_text, today or date.today())
+
+
+@lru_cache(maxsize=4096)
+def _parse_deadline_cached(deadline_text, today):
+    """Memoized body of parse_deadline; many postings share a deadline string."""
+    # Digit-based patterns don't care about case, so one lowercase copy serves all
+    text = deadline_text.strip().lower()
+
+    # Fast path: bare "2024-12-31" or "31/12/2024" can be sliced without regex
+    if len(text) == 10 and text[:2].isdecimal() and text[8:].isdecimal():
+        if text[4] == '-' and text[7] == '-' and text[2:4].isdecimal() and text[5:7].isdecimal():
+            return _mkdate(int(text[:4]), int(text[5:7]), int(text[8:]))
+        if text[2] in '/-' and text[5] in '/-' and text[3:5].isdecimal() and text[6:8].isdecimal():
+            day, month = _day_month(int(text[:2]), int(text[3:5]))
+            return _mkdate(int(text[6:]), month, day)
+
+    # ISO timestamps like "2024-12-31T23:59:59Z" go straight to ciso8601 if installed
+    if _ciso_parse_datetime is not None and 10 < len(text) <= 32 and text[4:5] == '-':
         try:
-            return datetime(year, month, day)
+            return _ciso_parse_datetime(deadline_text.strip()).date()
         except ValueError:
             pass
 
-    # Pattern 2: "December 31, 2024"
-    match = re.search(r'(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\s+(\d{1,2}),?\s+(\d{4})', deadline_lower)
-    if match:
-        month = month_map.get(match.group(1), 1)
-        day = int(match.group(2))
-        year = int(match.group(3))
+    # Patterns 1, 2 and 5 share one scan; a yearless "31 December" is only
+    # used if nothing more specific turns up
+    day_month = None
+    for match in _RE_MONTH_DATE.finditer(text):
+        if match.group(14):
+            # Pattern 1: "31 December 2024" or "31 Dec 2024"
+            day = int(match.group(1))
+            month = _matched_month(match, 2)
+            year = int(match.group(14))
+        elif match.group(28):
+            # Pattern 2: "December 31, 2024"
+            month = _matched_month(match, 15)
+            day = int(match.group(27))
+            year = int(match.group(28))
+        else:
+            day_month = day_month or match
+            continue
         try:
-            return datetime(year, month, day)
+            return date(year, month, day)
         except ValueError:
             pass
 
-    # Pattern 3: "31/12/2024" or "31-12-2024" (UK format: DD/MM/YYYY)
-    match = re.search(r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})', original_text)
+    # Pattern 3: "31/12/2024" (UK) or "12/31/2024" (US)
+    match = _RE_NUMERIC.search(text)
     if match:
-        day = int(match.group(1))
-        month = int(match.group(2))
+        day, month = _day_month(int(match.group(1)), int(match.group(2)))
         year = int(match.group(3))
-        # Validate it's a reasonable date (day <= 31, month <= 12)
-        if day <= 31 and month <= 12:
-            try:
-                return datetime(year, month, day)
-            except ValueError:
-                pass
+        try:
+            return date(year, month, day)
+        except ValueError:
+            pass
 
     # Pattern 4: "2024-12-31" (ISO format: YYYY-MM-DD)
-    match = re.search(r'(\d{4})-(\d{2})-(\d{2})', original_text)
+    match = _RE_ISO.search(text)
     if match:
         year = int(match.group(1))
         month = int(match.group(2))
         day = int(match.group(3))
         try:
-            return datetime(year, month, day)
+            return date(year, month, day)
         except ValueError:
             pass
 
     # Pattern 5: Just month and day "31 December" - assume next occurrence
-    match = re.search(r'(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)', deadline_lower)
-    if match:
-        day = int(match.group(1))
-        month = month_map.get(match.group(2), 1)
-        year = datetime.now().year
+    if day_month:
+        day = int(day_month.group(1))
+        month = _matched_month(day_month, 2)
+        year = today.year
         try:
-            parsed = datetime(year, month, day)
+            parsed = date(year, month, day)
             # If date is in the past, assume next year
-            if parsed < datetime.now():
-                parsed = datetime(year + 1, month, day)
+            if parsed < today:
+                parsed = date(year + 1, month, day)
             return parsed
         except ValueError:
             pass
 
-    return None
+    return DEADLINE_UNKNOWN
 
 
-def is_deadline_expired(deadline_text, grace_days=0):
+def is_deadline_expired(deadline_text, grace_days=0, today=None):
     """
     Check if a deadline has already passed.
 
     Args:
         deadline_text: The deadline string to check
         grace_days: Number of days grace period (negative = already passed is OK)
+        today: Reference day; pass one in to avoid re-reading the clock in a loop
 
     Returns:
-        (is_expired: bool, parsed_deadline: datetime or None)
+        (is_expired: bool, parsed_deadline: date or None)
     """
-    if not deadline_text or deadline_text in ['Not specified', 'Not Specified', '', 'N/A']:
+    if not deadline_text or deadline_text.strip() in _NO_DEADLINE:
         # No deadline specified - don't filter out
         return False, None
 
-    parsed = parse_deadline(deadline_text)
+    # Keyed on today's ordinal so cached results roll over at midnight
+    return _deadline_expired_cached(deadline_text, (today or date.today()).toordinal(), grace_days)
+
 
-    if parsed is None:
+@lru_cache(maxsize=8192)
+def _deadline_expired_cached(deadline_text, today_ord, grace_days):
+    """Memoized body of is_deadline_expired for re-filtering the same postings."""
+    today = date.fromordinal(today_ord)
+    parsed = parse_deadline(deadline_text, today)
+
+    if parsed is DEADLINE_UNKNOWN:
         # Couldn't parse - don't filter out (might still be valid)
         return False, None
 
-    cutoff = datetime.now() - timedelta(days=grace_days)
+    cutoff = today - timedelta(days=grace_days)
 
     if parsed < cutoff:
         return True, parsed
@@ -382,26 +875,375 @@ def is_deadline_expired(deadline_text, grace_days=0):
         return False, parsed
 
 
-def is_deadline_too_old(deadline_text, max_days_past=7):
+def is_deadline_too_old(deadline_text, max_days_past=7, today=None):
     """
     Check if a deadline is more than max_days_past in the past.
     This filters out clearly expired opportunities while allowing some grace.
     """
-    expired, parsed = is_deadline_expired(deadline_text, grace_days=max_days_past)
+    expired, parsed = is_deadline_expired(deadline_text, grace_days=max_days_past, today=today)
     return expired, parsed
 
+
+def deadline_ordinal(deadline_text, today=None):
+    """
+    Return the deadline as a date ordinal, or 0 if it can't be parsed.
+    Lets filtering loops compare plain integers against a precomputed cutoff.
+    """
+    parsed = parse_deadline(deadline_text, today)
+    return 0 if parsed is DEADLINE_UNKNOWN else parsed.toordinal()
+
+
+def _job_deadline_ordinal(job, today=None):
+    """
+    deadline_ordinal for a job dict, reusing the '_deadline_ord' that the
+    search step stores when it has already parsed the deadline.
+    """
+    deadline_ord = job.get('_deadline_ord')
+    if deadline_ord is None:
+        deadline_ord = deadline_ordinal(job.get('deadline', ''), today)
+    return deadline_ord
+
 GOOGLE_API_KEY = os.getenv("GOOGLE_SEARCH_API_KEY")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
+GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+GOOGLE_SEARCH_WORKERS = 8
+
+# Search responses are kept on disk for this many hours (0 turns it off), so
+# reruns don't repeat identical queries or spend the daily API quota
+GOOGLE_CACHE_FILE = "google_search_cache.json"
+GOOGLE_CACHE_HOURS = float(os.getenv("GOOGLE_SEARCH_CACHE_HOURS", "1"))
+
+
+def _google_search(query):
+    """
+    Run one Google Custom Search query.
+    Returns (items, error) so one failed query doesn't stop the others.
+    """
+    params = {
+        "key": GOOGLE_API_KEY,
+        "cx": GOOGLE_CSE_ID,
+        "q": query,
+        "num": 10
+    }
+    try:
+        response = _HTTP.get(GOOGLE_SEARCH_URL, params=params, timeout=10)
+        if response.status_code != 200:
+            return [], None
+        return response.json().get("items", []), None
+    except requests.exceptions.RetryError:
+        # Still rate-limited or failing after the retries: same as a non-200 reply
+        return [], None
+    except Exception as e:
+        return [], e
+
+
+def _load_google_cache():
+    """Return the cached search responses that are still fresh, keyed by query."""
+    if GOOGLE_CACHE_HOURS <= 0 or not os.path.exists(GOOGLE_CACHE_FILE):
+        return {}
+    try:
+        with open(GOOGLE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        oldest = (datetime.now() - timedelta(hours=GOOGLE_CACHE_HOURS)).isoformat()
+        return {query: entry for query, entry in cache.items() if entry.get("timestamp", "") >= oldest}
+    except Exception as e:
+        print(f"   ⚠️  Could not load search cache: {e}")
+        return {}
+
+
+def _save_google_cache(cache):
+    """Write the search responses back, swapping the file in like save_cache."""
+    if GOOGLE_CACHE_HOURS <= 0:
+        return
+    try:
+        tmp_file = GOOGLE_CACHE_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f, separators=(',', ':'))
+        os.replace(tmp_file, GOOGLE_CACHE_FILE)
+    except Exception as e:
+        print(f"   ⚠️  Could not save search cache: {e}")
+
+
+def _run_google_queries(queries):
+    """
+    Run search queries on a thread pool (the work is network-bound), answering
+    recently run ones from the on-disk cache instead.
+    Yields (query, (items, error)) in the original query order.
+    """
+    cache = _load_google_cache()
+    updated = False
+    try:
+        with ThreadPoolExecutor(max_workers=GOOGLE_SEARCH_WORKERS) as executor:
+            futures = [None if query in cache else executor.submit(_google_search, query) for query in queries]
+            for query, future in zip(queries, futures):
+                if future is None:
+                    yield query, (cache[query]["items"], None)
+                    continue
+                items, error = future.result()
+                # Empty responses aren't kept: a non-200 reply (e.g. quota
+                # exhausted) also comes back empty
+                if items:
+                    cache[query] = {"timestamp": datetime.now().isoformat(), "items": items}
+                    updated = True
+                yield query, (items, error)
+    finally:
+        # Also runs if the run is interrupted or the caller stops early, so
+        # the responses received so far are kept
+        if updated:
+            _save_google_cache(cache)
 
 
 # ============================================================================
 # URL VALIDATION - Detect real job postings vs aggregator/search pages
 # ============================================================================
 
+def _build_alternation(patterns):
+    """
+    Compile a list of regexes into one alternation so a category is checked
+    in a single pass. Patterns sharing a literal first character are grouped
+    under it, e.g. '/(?:job/\\d+|jobs/\\d+)', so that character is tested once.
+    """
+    groups = {}
+    for pattern in sorted(patterns):
+        # Only factor out a plain character that isn't followed by a quantifier
+        if (pattern[0].isalnum() or pattern[0] in '/-_') and pattern[1:2] not in ('*', '+', '?', '{'):
+            head, tail = pattern[0], pattern[1:]
+        else:
+            head, tail = '', pattern
+        groups.setdefault(head, []).append(tail)
+
+    branches = []
+    for head, tails in groups.items():
+        if head and len(tails) > 1:
+            branches.append(head + '(?:' + '|'.join(tails) + ')')
+        else:
+            branches.extend(head + tail for tail in tails)
+    return re.compile('|'.join(branches))
+
+
+def _compile_patterns(patterns):
+    """
+    Split regex sources into plain literals, which are cheaper to check with
+    `in`, and a _build_alternation regex for the rest.
+    Returns (literals, regex or None) for use with _matches_any.
+    """
+    literals, regexes = [], []
+    for pattern in patterns:
+        # Escaped punctuation like '\.' or '\?' is still a plain character
+        if re.search(r'[.^$*+?{}\[\]|()\\]', re.sub(r'\\\W', '', pattern)):
+            regexes.append(pattern)
+        else:
+            literals.append(re.sub(r'\\(\W)', r'\1', pattern))
+    return tuple(literals), (_build_alternation(regexes) if regexes else None)
+
+
+def _matches_any(compiled, text):
+    """Check text against a (literals, regex) pair from _compile_patterns."""
+    literals, regex = compiled
+    return any(literal in text for literal in literals) or (regex is not None and regex.search(text) is not None)
+
+
+# Known aggregator/search URL patterns on any host (reject)
+_AGGREGATOR_URL_PATTERNS = _compile_patterns([
+    r'/jobs/search',
+    r'/jobs\?',
+    r'/search\?',
+    r'/jobs-list',
+    r'/job-search',
+    r'/careers/search',
+    r'/vacancies\?',
+    r'glassdoor\..*/Job/',  # Glassdoor search pages
+])
+
+# Title patterns that indicate aggregator pages (reject)
+_AGGREGATOR_TITLE_PATTERNS = _compile_patterns([
+    r'\d{1,3},?\d{3}\+?\s+.*jobs',  # "6,000+ ML jobs"
+    r'\d+\s+.*jobs\s+in',            # "500 jobs in London"
+    r'jobs\s+in\s+(united kingdom|london|uk|england)',
+    r'job openings',
+    r'job listings',
+    r'search results',
+    r'browse.*jobs',
+    r'find.*jobs',
+])
+
+# Strong indicators of actual job postings on any host (accept)
+_JOB_POSTING_PATTERNS = _compile_patterns([
+    r'/job/\d+',           # /job/12345
+    r'/jobs/\d+',          # /jobs/12345
+    r'/position/\d+',
+    r'/vacancy/\d+',
+    r'/posting/\d+',
+    r'/careers/.*apply',
+    r'/apply/\d+',
+])
+
+_NO_PATTERNS = ((), None)
+
+# Site-specific rules, keyed by domain: (aggregator patterns, job posting patterns).
+# Only the rules for the URL's own host are checked, on top of the generic ones.
+_HOST_RULES = {
+    'linkedin.com': (
+        _compile_patterns([
+            r'linkedin\.com/jobs/[a-z-]+-jobs$',  # LinkedIn category pages
+            r'linkedin\.com/jobs/[a-z-]+-jobs-[a-z]+$',  # LinkedIn location pages
+        ]),
+        _compile_patterns([r'linkedin\.com/jobs/view/']),  # LinkedIn specific job view
+    ),
+    'indeed.com': (_compile_patterns([r'indeed\.com/jobs\?', r'indeed\.com/q-']), _NO_PATTERNS),
+    'totaljobs.com': (_compile_patterns([r'totaljobs\.com/jobs/']), _NO_PATTERNS),
+    'reed.co.uk': (_compile_patterns([r'reed\.co\.uk/jobs/']), _NO_PATTERNS),
+    'greenhouse.io': (_NO_PATTERNS, _compile_patterns([r'greenhouse\.io/.*job', r'boards\.greenhouse\.io/'])),
+    'lever.co': (_NO_PATTERNS, _compile_patterns([r'lever\.co/', r'jobs\.lever\.co/'])),
+    'workable.com': (_NO_PATTERNS, _compile_patterns([r'workable\.com/', r'apply\.workable\.com/'])),
+    'smartrecruiters.com': (_NO_PATTERNS, _compile_patterns([r'smartrecruiters\.com/'])),
+    'jobs.ac.uk': (_NO_PATTERNS, _compile_patterns([r'jobs\.ac\.uk/job/'])),
+}
+
+# Company career sections; a URL only counts if a more specific path follows
+_COMPANY_CAREER_RE = _build_alternation([
+    r'/careers/',
+    r'/jobs/',
+    r'/opportunities/',
+    r'/vacancies/',
+])
+
+# Used by calculate_quality_score
+_JOB_ID_RE = re.compile(r'/job/\d+|/jobs/\d+|/position/\d+|/view/\d+')
+_AGG_TITLE_COUNT_RE = re.compile(r'\d{2,},?\d*\+?\s+jobs')
+# Hosts (or parent domains) of known quality job platforms, matched against
+# _host_suffixes so only the URL's host is checked
+_QUALITY_DOMAINS = frozenset(['greenhouse.io', 'lever.co', 'workable.com', 'jobs.ac.uk', 'smartrecruiters.com'])
+_SEARCH_URL_MARKERS = ('/search?', '/jobs?q=', 'job-search')
+
+# Placeholder company names given to listings we couldn't attribute
+_PLACEHOLDER_COMPANIES = frozenset(['linkedin job', 'indeed listing', 'glassdoor listing', 'unknown', 'see listing'])
+_AGGREGATOR_COMPANIES = frozenset(['linkedin job', 'indeed listing', 'glassdoor listing'])
+
+
+def _keyword_groups_re(**groups):
+    """
+    Compile named keyword groups into one regex.
+
+    Each group becomes a named alternative inside a lookahead, so a single
+    finditer() reports every group with a keyword (as a substring) in the text.
+    """
+    alternatives = '|'.join(
+        '(?P<%s>%s)' % (name, '|'.join(re.escape(keyword) for keyword in keywords))
+        for name, keywords in groups.items()
+    )
+    return re.compile('(?=%s)' % alternatives)
+
+
+def _matched_groups(regex, text, end=None):
+    """Return the names of the keyword groups of regex found in text[:end]."""
+    if end is None:
+        end = len(text)
+    return {match.lastgroup for match in regex.finditer(text, 0, end)}
+
+
+_QUALITY_KEYWORDS_RE = _keyword_groups_re(
+    role=['engineer', 'scientist', 'analyst', 'developer', 'researcher'],
+    graduate=[
+        'graduate scheme', 'graduate programme', 'graduate program',
+        'early careers', 'entry level', 'entry-level', 'junior',
+        'new graduate', 'recent graduate', 'graduate role',
+        'graduate position', 'trainee', 'apprentice', '0-2 years',
+        '1-2 years', 'no experience required',
+    ],
+    healthcare=['healthcare', 'medical', 'biomedical', 'clinical', 'health', 'nhs'],
+)
+
+# Points per keyword group, found in the title or only in the description.
+# Graduate roles get a big boost in the title and a smaller one in the description.
+_TITLE_KEYWORD_POINTS = {'role': 10, 'graduate': 25, 'healthcare': 10}
+_INTRO_KEYWORD_POINTS = {'role': 0, 'graduate': 15, 'healthcare': 10}
+
+# PhD-specific bonuses
+_PHD_TOP_UNIVERSITIES = ('cam.ac.uk', 'ox.ac.uk', 'imperial', 'ucl', 'ed.ac.uk')
+_PHD_KEYWORDS_RE = _keyword_groups_re(
+    funded=['funded', 'stipend', 'scholarship'],
+    cdt=['cdt', 'centre for doctoral'],
+)
+
+# Plain-substring senior indicators for is_senior_role, checked with `in`
+_SENIOR_TITLE_KEYWORDS = (
+    'senior', 'sr.', 'sr ', 'lead', 'principal', 'staff', 'head of',
+    'director', 'vp ', 'vice president', 'chief', 'manager', 'team lead',
+)
+_SENIOR_REQ_PHRASES = (
+    'proven track record', 'extensive experience', 'deep expertise',
+    'significant experience', '5+ years', '7+ years', '10+ years',
+    'leadership experience', 'management experience', 'phd required',
+)
+
+# Experience requirements, used by is_senior_role
+_EXPERIENCE_RES = tuple(re.compile(p) for p in [
+    r'(\d+)\+?\s*years?\s*(of\s+)?(experience|exp)',
+    r'(\d+)\+?\s*years?\s*(in\s+)?(industry|professional)',
+    r'minimum\s+(\d+)\s*years?',
+    r'at\s+least\s+(\d+)\s*years?',
+])
+
+
+@lru_cache(maxsize=8192)
+def _host_suffixes(url):
+    """
+    Return the URL's host and each parent domain, e.g. ('uk.indeed.com', 'indeed.com', 'com').
+    Memoized so URL validation and company lookup parse each URL once.
+    """
+    try:
+        host = urlsplit(url).hostname or ''
+    except ValueError:
+        return ()
+    if host.startswith('www.'):
+        host = host[4:]
+    suffixes = []
+    while host:
+        suffixes.append(host)
+        host = host.partition('.')[2]
+    return tuple(suffixes)
+
+
+# Query parameters that only record where a click came from (plus any utm_*)
+_TRACKING_PARAMS = frozenset(['gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'trk', 'trackingid', 'refid'])
+
+
+def _canonical_url(url):
+    """
+    Dedup key for a URL: lowercase scheme and host, no fragment, tracking
+    parameters or trailing slash, so the same posting is only processed once.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = parts.query
+    if query:
+        kept = []
+        for param in query.split('&'):
+            name = param.partition('=')[0].lower()
+            if param and not name.startswith('utm_') and name not in _TRACKING_PARAMS:
+                kept.append(param)
+        query = '&'.join(kept)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+
+def _host_rules(url):
+    """Return the _HOST_RULES entry for a URL's host, or empty rules."""
+    for host in _host_suffixes(url):
+        rules = _HOST_RULES.get(host)
+        if rules:
+            return rules
+    return _NO_PATTERNS, _NO_PATTERNS
+
+
+@lru_cache(maxsize=8192)
 def is_valid_job_url(url, title=""):
     """
     Validate if a URL is likely a real job posting, not an aggregator page.
-    Returns (is_valid, reason)
+    Returns (is_valid, reason). Memoized: the same URL is checked during
+    search and again in post-processing.
     """
     # Handle None or empty URL
     if not url:
@@ -409,101 +1251,67 @@ def is_valid_job_url(url, title=""):
 
     url_lower = url.lower()
     title_lower = title.lower() if title else ""
+    host_aggregator, host_posting = _host_rules(url)
 
     # REJECT: Known aggregator/search URL patterns
-    aggregator_patterns = [
-        r'/jobs/search',
-        r'/jobs\?',
-        r'/search\?',
-        r'/jobs-list',
-        r'/job-search',
-        r'/careers/search',
-        r'/vacancies\?',
-        r'linkedin\.com/jobs/[a-z-]+-jobs$',  # LinkedIn category pages
-        r'linkedin\.com/jobs/[a-z-]+-jobs-[a-z]+$',  # LinkedIn location pages
-        r'indeed\.com/jobs\?',
-        r'indeed\.com/q-',
-        r'glassdoor\..*/Job/',  # Glassdoor search pages
-        r'totaljobs\.com/jobs/',
-        r'reed\.co\.uk/jobs/',
-    ]
-
-    for pattern in aggregator_patterns:
-        if re.search(pattern, url_lower):
-            return False, "Aggregator search page"
+    if _matches_any(_AGGREGATOR_URL_PATTERNS, url_lower) or _matches_any(host_aggregator, url_lower):
+        return False, "Aggregator search page"
 
     # REJECT: Title patterns that indicate aggregator pages
-    aggregator_title_patterns = [
-        r'\d{1,3},?\d{3}\+?\s+.*jobs',  # "6,000+ ML jobs"
-        r'\d+\s+.*jobs\s+in',            # "500 jobs in London"
-        r'jobs\s+in\s+(united kingdom|london|uk|england)',
-        r'job openings',
-        r'job listings',
-        r'search results',
-        r'browse.*jobs',
-        r'find.*jobs',
-    ]
-
-    for pattern in aggregator_title_patterns:
-        if re.search(pattern, title_lower):
-            return False, "Aggregator title pattern"
+    if _matches_any(_AGGREGATOR_TITLE_PATTERNS, title_lower):
+        return False, "Aggregator title pattern"
 
     # ACCEPT: Strong indicators of actual job postings
-    job_posting_patterns = [
-        r'/job/\d+',           # /job/12345
-        r'/jobs/\d+',          # /jobs/12345
-        r'/position/\d+',
-        r'/vacancy/\d+',
-        r'/posting/\d+',
-        r'/careers/.*apply',
-        r'/apply/\d+',
-        r'greenhouse\.io/.*job',
-        r'lever\.co/',
-        r'workable\.com/',
-        r'smartrecruiters\.com/',
-        r'jobs\.lever\.co/',
-        r'boards\.greenhouse\.io/',
-        r'apply\.workable\.com/',
-        r'jobs\.ac\.uk/job/',
-        r'linkedin\.com/jobs/view/',  # LinkedIn specific job view
-    ]
-
-    for pattern in job_posting_patterns:
-        if re.search(pattern, url_lower):
-            return True, "Job posting URL pattern"
-
-    # NEUTRAL: Check for company career pages (generally OK)
-    company_career_patterns = [
-        r'/careers/',
-        r'/jobs/',
-        r'/opportunities/',
-        r'/vacancies/',
-    ]
-
-    # If it's a company career page with a specific path (not just /careers/)
-    for pattern in company_career_patterns:
-        if re.search(pattern, url_lower):
-            # Check if there's more path after the careers section
-            match = re.search(pattern + r'.+', url_lower)
-            if match:
-                return True, "Company career page with specific job"
+    if _matches_any(_JOB_POSTING_PATTERNS, url_lower) or _matches_any(host_posting, url_lower):
+        return True, "Job posting URL pattern"
+
+    # NEUTRAL: Company career page with a specific path (not just /careers/)
+    career = _COMPANY_CAREER_RE.search(url_lower)
+    if career and career.end() < len(url_lower):
+        return True, "Company career page with specific job"
 
     # Default: Accept but with lower confidence
     return True, "Default accept"
 
 
+@lru_cache(maxsize=None)
+def _past_years(current_year):
+    """Year strings from 2020 up to the year before current_year, oldest first."""
+    return tuple(str(y) for y in range(2020, current_year))
+
+
+@lru_cache(maxsize=None)
+def _month_year_re(year):
+    """Compiled 'september 2024'-style pattern for one year (a string)."""
+    return re.compile(rf'{_MONTH_FULL}\s+{year}')
+
+
 def is_job_from_past_year(job):
     """
     Check if a job appears to be from a past year (2024 or earlier).
     Returns (is_old, reason) tuple.
     """
-    current_year = datetime.now().year
-    past_years = [str(y) for y in range(2020, current_year)]  # 2020-2024
+    return _is_from_past_year(
+        (job.get('title') or '').lower(),
+        (job.get('description') or '').lower(),
+        (job.get('deadline') or '').lower(),
+        (job.get('post_date') or '').lower(),
+    )
+
 
-    title = (job.get('title') or '').lower()
-    description = (job.get('description') or '').lower()
-    deadline = (job.get('deadline') or '').lower()
-    post_date = (job.get('post_date') or '').lower()
+def _is_from_past_year(title, description, deadline, post_date):
+    """is_job_from_past_year on fields that are already lowercased."""
+    # Keyed on the current year so cached results roll over at New Year
+    return _past_year_cached(title, description, deadline, post_date, datetime.now().year)
+
+
+@lru_cache(maxsize=2048)
+def _past_year_cached(title, description, deadline, post_date, current_year):
+    """
+    Memoized body of _is_from_past_year. Scoring during search and the
+    find_all filters check the same text, so the second check is a lookup.
+    """
+    past_years = _past_years(current_year)  # 2020-2024
 
     # Check for past year mentions in key fields
     for year in past_years:
@@ -519,12 +1327,12 @@ def is_job_from_past_year(job):
         if year in post_date and 'posted' not in post_date:
             return True, f"Post date in {year}"
 
-    # Check for specific patterns like "September 2024" in description (first 500 chars)
-    desc_start = description[:500]
+    # Check for specific patterns like "September 2024" in description (first 500 chars,
+    # bounded by find/search positions rather than a sliced copy)
     for year in past_years:
-        # Pattern: month + year in description header area
-        month_year_pattern = rf'(january|february|march|april|may|june|july|august|september|october|november|december)\s+{year}'
-        if re.search(month_year_pattern, desc_start):
+        # Pattern: month + year in description header area (the year itself
+        # must be there, a much cheaper check than the regex)
+        if description.find(year, 0, 500) >= 0 and _month_year_re(year).search(description, 0, 500):
             return True, f"Description mentions {year}"
 
     return False, None
@@ -535,47 +1343,46 @@ def is_senior_role(job):
     Check if a job is a senior-level role (not suitable for recent graduates).
     Returns (is_senior, reason) tuple.
     """
-    title = (job.get('title') or '').lower()
-    description = (job.get('description') or '').lower()
-    requirements = job.get('requirements', [])
-    req_text = ' '.join([str(r).lower() for r in requirements])
+    return _is_senior(
+        (job.get('title') or '').lower(),
+        (job.get('description') or '').lower(),
+        _requirements_text(job),
+    )
 
-    # STRONG indicators in title - immediate disqualification
-    senior_title_keywords = [
-        'senior', 'sr.', 'sr ', 'lead', 'principal', 'staff', 'head of',
-        'director', 'vp ', 'vice president', 'chief', 'manager', 'team lead'
-    ]
 
-    for keyword in senior_title_keywords:
+def _requirements_text(job):
+    """Join a job's requirements into one lowercase string."""
+    return ' '.join([str(r).lower() for r in job.get('requirements', [])])
+
+
+@lru_cache(maxsize=2048)
+def _is_senior(title, description, req_text):
+    """
+    is_senior_role on fields that are already lowercased. Memoized like
+    _past_year_cached, as scoring and filtering check the same text.
+    """
+    # STRONG indicators in title - immediate disqualification
+    for keyword in _SENIOR_TITLE_KEYWORDS:
         if keyword in title:
             return True, f"Title contains '{keyword}'"
 
     # Experience requirements - check for high years
-    experience_patterns = [
-        r'(\d+)\+?\s*years?\s*(of\s+)?(experience|exp)',
-        r'(\d+)\+?\s*years?\s*(in\s+)?(industry|professional)',
-        r'minimum\s+(\d+)\s*years?',
-        r'at\s+least\s+(\d+)\s*years?',
-    ]
-
     combined_text = f"{description} {req_text}"
 
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, combined_text)
-        for match in matches:
-            years = int(match[0]) if match[0].isdigit() else 0
-            if years >= 5:
-                return True, f"Requires {years}+ years experience"
+    # Every experience pattern needs "year", so one substring check can rule
+    # them all out before any regex scan
+    if 'year' in combined_text:
+        for pattern in _EXPERIENCE_RES:
+            # finditer stops at the first senior match; group 1 is always the
+            # number of years
+            for match in pattern.finditer(combined_text):
+                years = int(match.group(1))
+                if years >= 5:
+                    return True, f"Requires {years}+ years experience"
 
     # Check requirements list for senior indicators
-    senior_req_phrases = [
-        'proven track record', 'extensive experience', 'deep expertise',
-        'significant experience', '5+ years', '7+ years', '10+ years',
-        'leadership experience', 'management experience', 'phd required'
-    ]
-
-    for phrase in senior_req_phrases:
-        if phrase in req_text or phrase in description[:1000]:
+    for phrase in _SENIOR_REQ_PHRASES:
+        if phrase in req_text or description.find(phrase, 0, 1000) >= 0:
             return True, f"Requirements mention '{phrase}'"
 
     return False, None
@@ -591,26 +1398,36 @@ def calculate_quality_score(job):
     - Past year detection (penalized)
     - Graduate-friendly indicators (boosted)
     """
-    score = 50  # Base score
-
     # Use 'or' to handle both missing keys AND None values
-    title = (job.get('title') or '').lower()
-    url = (job.get('url') or '').lower()
-    description = (job.get('description') or '').lower()
-    company = (job.get('company') or '').lower()
+    return _quality_score(
+        job,
+        (job.get('title') or '').lower(),
+        (job.get('url') or '').lower(),
+        (job.get('description') or '').lower(),
+        (job.get('company') or '').lower(),
+    )
+
+
+def _quality_score(job, title, url, description, company):
+    """calculate_quality_score on fields that are already lowercased."""
+    score = 50  # Base score
 
     # =====================================================
     # CRITICAL NEGATIVE SIGNALS (check first)
     # =====================================================
 
     # Check if job is from a past year (2024 or earlier)
-    is_old, old_reason = is_job_from_past_year(job)
+    is_old, old_reason = _is_from_past_year(
+        title, description,
+        (job.get('deadline') or '').lower(),
+        (job.get('post_date') or '').lower(),
+    )
     if is_old:
         score -= 50  # Heavy penalty for old jobs
         job['_filter_reason'] = old_reason  # Track why for debugging
 
     # Check if job is senior level
-    is_senior, senior_reason = is_senior_role(job)
+    is_senior, senior_reason = _is_senior(title, description, _requirements_text(job))
     if is_senior:
         score -= 40  # Heavy penalty for senior roles
         job['_filter_reason'] = senior_reason
@@ -619,49 +1436,33 @@ def calculate_quality_score(job):
     # POSITIVE signals
     # =====================================================
 
-    # Specific job title (not generic)
-    if any(word in title for word in ['engineer', 'scientist', 'analyst', 'developer', 'researcher']):
-        score += 10
+    # Keyword groups in the title, then any others in the start of the description:
+    # specific role title, graduate-friendly wording (HIGH priority!) and
+    # healthcare/biomedical interest
+    title_groups = _matched_groups(_QUALITY_KEYWORDS_RE, title)
+    intro_groups = _matched_groups(_QUALITY_KEYWORDS_RE, description, 500) - title_groups
+    score += sum(_TITLE_KEYWORD_POINTS[group] for group in title_groups)
+    score += sum(_INTRO_KEYWORD_POINTS[group] for group in intro_groups)
 
     # Has a real company name (not "LinkedIn Job" or "Indeed Listing")
-    if company and company not in ['linkedin job', 'indeed listing', 'glassdoor listing', 'unknown', 'see listing']:
+    if company and company not in _PLACEHOLDER_COMPANIES:
         score += 15
 
     # URL contains job ID or specific posting indicator
-    if re.search(r'/job/\d+|/jobs/\d+|/position/\d+|/view/\d+', url):
+    if _JOB_ID_RE.search(url):
         score += 15
 
     # From known quality job platforms
-    quality_domains = ['greenhouse.io', 'lever.co', 'workable.com', 'jobs.ac.uk', 'smartrecruiters']
-    if any(domain in url for domain in quality_domains):
+    if not _QUALITY_DOMAINS.isdisjoint(_host_suffixes(url)):
         score += 10
 
     # Has meaningful description
     if len(description) > 100:
         score += 5
 
-    # GRADUATE-FRIENDLY indicators (HIGH priority!)
-    graduate_keywords = [
-        'graduate scheme', 'graduate programme', 'graduate program',
-        'early careers', 'entry level', 'entry-level', 'junior',
-        'new graduate', 'recent graduate', 'graduate role',
-        'graduate position', 'trainee', 'apprentice', '0-2 years',
-        '1-2 years', 'no experience required'
-    ]
-
-    if any(phrase in title for phrase in graduate_keywords):
-        score += 25  # Big boost for graduate roles in title
-    elif any(phrase in description[:500] for phrase in graduate_keywords):
-        score += 15  # Smaller boost if in description
-
-    # Healthcare/biomedical indicators (user's interest)
-    if any(word in title or word in description[:500]
-           for word in ['healthcare', 'medical', 'biomedical', 'clinical', 'health', 'nhs']):
-        score += 10
-
     # Current year indicator (2025) - good sign
     current_year = str(datetime.now().year)
-    if current_year in title or current_year in description[:300]:
+    if current_year in title or description.find(current_year, 0, 300) >= 0:
         score += 10
 
     # =====================================================
@@ -669,11 +1470,11 @@ def calculate_quality_score(job):
     # =====================================================
 
     # Aggregator indicators in title
-    if re.search(r'\d{2,},?\d*\+?\s+jobs', title):
+    if _AGG_TITLE_COUNT_RE.search(title):
         score -= 40
 
     # Generic company names
-    if company in ['linkedin job', 'indeed listing', 'glassdoor listing']:
+    if company in _AGGREGATOR_COMPANIES:
         score -= 10
 
     # Very short title (likely not a real job posting)
@@ -681,12 +1482,41 @@ def calculate_quality_score(job):
         score -= 15
 
     # URL is a search page
-    if any(pattern in url for pattern in ['/search?', '/jobs?q=', 'job-search']):
+    if any(marker in url for marker in _SEARCH_URL_MARKERS):
         score -= 30
 
     return max(0, min(100, score))  # Clamp to 0-100
 
 
+def _phd_keyword_bonus(title, description):
+    """Bonus points for funded/CDT keywords in a lowercased PhD title or description."""
+    groups = _matched_groups(_PHD_KEYWORDS_RE, title) | _matched_groups(_PHD_KEYWORDS_RE, description)
+    bonus = 0
+    if 'funded' in groups:
+        bonus += 15
+    if 'cdt' in groups:
+        bonus += 10
+    return bonus
+
+
+def _stream_search(results, label, search_type):
+    """
+    Yield search results as they arrive, appending each to the crash-recovery
+    cache first. A search error ends the stream rather than the whole run.
+    """
+    start_cache(search_type)
+    found = 0
+    try:
+        for result in results:
+            append_cache(result)
+            found += 1
+            yield result
+    except Exception as e:
+        print(f"❌ Google Search error: {e}\n")
+        return
+    print(f"✅ Found {found} {label} from Google Search\n")
+
+
 def find_all_industry_jobs():
     """
     Find industry ML jobs using Google Custom Search API.
@@ -701,33 +1531,8 @@ def find_all_industry_jobs():
     print("💼 INDUSTRY JOB SEARCH (ENHANCED)")
     print("="*60 + "\n")
 
-    all_jobs = []
-
-    # Google Search for jobs
-    print("📍 Google Search (Enhanced)")
-    print("-" * 60)
-
-    try:
-        google_jobs = search_google_industry_jobs()
-        all_jobs.extend(google_jobs)
-        print(f"✅ Found {len(google_jobs)} jobs from Google Search\n")
-    except Exception as e:
-        print(f"❌ Google Search error: {e}\n")
-
-    # Deduplicate by URL
-    seen_urls = set()
-    unique_jobs = []
-
-    for job in all_jobs:
-        if job['url'] not in seen_urls:
-            seen_urls.add(job['url'])
-            unique_jobs.append(job)
-
-    # SAVE CACHE before post-processing (crash recovery)
-    save_cache(unique_jobs, search_type="industry")
-
-    # POST-PROCESSING: Validate and filter all jobs
-    print("📍 POST-PROCESSING: Validation & Filtering")
+    # Google Search results stream straight into validation
+    print("📍 Google Search (Enhanced) + Validation & Filtering")
     print("-" * 60)
 
     validated_jobs = []
@@ -737,50 +1542,65 @@ def find_all_industry_jobs():
     senior_count = 0
     low_quality_count = 0
 
-    for job in unique_jobs:
+    today = date.today()
+    cutoff_ord = (today - timedelta(days=7)).toordinal()
+
+    # Validate in a single pass (the search already dropped duplicate URLs)
+    for job in _stream_search(_iter_google_industry_jobs(), "jobs", "industry"):
+        url = job.get('url', '')
+
         # Check URL validity
-        is_valid, reason = is_valid_job_url(job.get('url', ''), job.get('title', ''))
+        is_valid, reason = is_valid_job_url(url, job.get('title', ''))
         if not is_valid:
             invalid_count += 1
             continue
 
-        # Check deadline
+        # Check deadline (ordinal 0 = no parseable deadline, keep it)
         deadline = job.get('deadline', '')
-        if deadline and deadline not in ['Not specified', 'Not Specified', '', 'N/A']:
-            is_expired, parsed_date = is_deadline_too_old(deadline, max_days_past=7)
-            if is_expired:
-                expired_count += 1
-                print(f"   ⏭️  Expired: {job.get('title', 'Unknown')[:40]}... (deadline: {deadline})")
-                continue
+        if 0 < _job_deadline_ordinal(job, today) < cutoff_ord:
+            expired_count += 1
+            _verbose(f"   ⏭️  Expired: {job.get('title', 'Unknown')[:40]}... (deadline: {deadline})")
+            continue
+
+        # Lowercase the text fields once for the checks below
+        title = (job.get('title') or '').lower()
+        description = (job.get('description') or '').lower()
 
         # Check if job is from a past year (2024 or earlier)
-        is_old, old_reason = is_job_from_past_year(job)
+        is_old, old_reason = _is_from_past_year(
+            title, description,
+            (job.get('deadline') or '').lower(),
+            (job.get('post_date') or '').lower(),
+        )
         if is_old:
             old_year_count += 1
-            print(f"   ⏭️  Old job: {job.get('title', 'Unknown')[:40]}... ({old_reason})")
+            _verbose(f"   ⏭️  Old job: {job.get('title', 'Unknown')[:40]}... ({old_reason})")
             continue
 
         # Check if job is senior level
-        is_senior, senior_reason = is_senior_role(job)
+        is_senior, senior_reason = _is_senior(title, description, _requirements_text(job))
         if is_senior:
             senior_count += 1
-            print(f"   ⏭️  Senior: {job.get('title', 'Unknown')[:40]}... ({senior_reason})")
+            _verbose(f"   ⏭️  Senior: {job.get('title', 'Unknown')[:40]}... ({senior_reason})")
             continue
 
         # Add quality score if not already present
+        # (search results arrive already scored)
         if 'quality_score' not in job:
-            job['quality_score'] = calculate_quality_score(job)
+            job['quality_score'] = _quality_score(
+                job, title, url.lower(), description, (job.get('company') or '').lower(),
+            )
 
         # Filter out very low quality jobs
         if job['quality_score'] < 25:
             low_quality_count += 1
-            print(f"   ⏭️  Low quality ({job['quality_score']}): {job.get('title', 'Unknown')[:40]}...")
+            _verbose(f"   ⏭️  Low quality ({job['quality_score']}): {job.get('title', 'Unknown')[:40]}...")
             continue
 
         validated_jobs.append(job)
 
-    # Sort by quality score
-    validated_jobs.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
+    # Sort by quality score (every validated job has one by now)
+    validated_jobs.sort(key=itemgetter('quality_score'), reverse=True)
 
     print(f"\n   Filtered out:")
     print(f"      • {invalid_count} invalid URLs")
@@ -813,33 +1633,8 @@ def find_all_phd_positions():
     print("🎓 PHD POSITION SEARCH (ENHANCED)")
     print("="*60 + "\n")
 
-    all_positions = []
-
-    # Google Search for PhD positions
-    print("📍 Google Search (Enhanced)")
-    print("-" * 60)
-
-    try:
-        google_positions = search_google_phd_positions()
-        all_positions.extend(google_positions)
-        print(f"✅ Found {len(google_positions)} positions from Google Search\n")
-    except Exception as e:
-        print(f"❌ Google Search error: {e}\n")
-
-    # Deduplicate
-    seen_urls = set()
-    unique_positions = []
-
-    for pos in all_positions:
-        if pos['url'] not in seen_urls:
-            seen_urls.add(pos['url'])
-            unique_positions.append(pos)
-
-    # SAVE CACHE before post-processing (crash recovery)
-    save_cache(unique_positions, search_type="phd")
-
-    # POST-PROCESSING: Validate and filter all positions
-    print("📍 POST-PROCESSING: Validation & Deadline Filtering")
+    # Google Search results stream straight into validation
+    print("📍 Google Search (Enhanced) + Validation & Deadline Filtering")
     print("-" * 60)
 
     validated_positions = []
@@ -848,53 +1643,62 @@ def find_all_phd_positions():
     old_year_count = 0
     low_quality_count = 0
 
-    for pos in unique_positions:
+    today = date.today()
+    cutoff_ord = (today - timedelta(days=7)).toordinal()
+
+    # Validate in a single pass (the search already dropped duplicate URLs)
+    for pos in _stream_search(_iter_google_phd_positions(), "positions", "phd"):
+        url = pos.get('url', '')
+
         # Check URL validity
-        is_valid, _ = is_valid_job_url(pos.get('url', ''), pos.get('title', ''))
+        is_valid, _ = is_valid_job_url(url, pos.get('title', ''))
         if not is_valid:
             invalid_count += 1
             continue
 
         # CHECK DEADLINE - This is crucial for PhDs!
-        deadline = pos.get('deadline', '')
-        if deadline and deadline not in ['Not specified', 'Not Specified', '', 'N/A']:
-            is_expired, parsed_date = is_deadline_too_old(deadline, max_days_past=7)
-            if is_expired:
-                expired_count += 1
-                date_str = parsed_date.strftime('%d %b %Y') if parsed_date else deadline
-                print(f"   ⏭️  EXPIRED: {pos.get('title', 'Unknown')[:40]}... (deadline: {date_str})")
-                continue
+        deadline_ord = _job_deadline_ordinal(pos, today)
+        if 0 < deadline_ord < cutoff_ord:
+            expired_count += 1
+            date_str = date.fromordinal(deadline_ord).strftime('%d %b %Y')
+            _verbose(f"   ⏭️  EXPIRED: {pos.get('title', 'Unknown')[:40]}... (deadline: {date_str})")
+            continue
+
+        # Lowercase the text fields once for the checks below
+        title = (pos.get('title') or '').lower()
+        description = (pos.get('description') or '').lower()
 
         # Check if position is from a past year (2024 or earlier)
-        is_old, old_reason = is_job_from_past_year(pos)
+        is_old, old_reason = _is_from_past_year(
+            title, description,
+            (pos.get('deadline') or '').lower(),
+            (pos.get('post_date') or '').lower(),
+        )
         if is_old:
             old_year_count += 1
-            print(f"   ⏭️  Old position: {pos.get('title', 'Unknown')[:40]}... ({old_reason})")
+            _verbose(f"   ⏭️  Old position: {pos.get('title', 'Unknown')[:40]}... ({old_reason})")
             continue
 
         # Add quality score if not already present
+        # (search results arrive already scored)
         if 'quality_score' not in pos:
-            pos['quality_score'] = calculate_quality_score(pos)
+            pos['quality_score'] = _quality_score(
+                pos, title, url.lower(), description, (pos.get('company') or '').lower(),
+            )
 
             # PhD-specific bonus points
-            title_lower = (pos.get('title') or '').lower()
-            desc_lower = (pos.get('description') or '').lower()
-
-            if any(word in title_lower or word in desc_lower for word in ['funded', 'stipend', 'scholarship']):
-                pos['quality_score'] += 15
-            if any(word in title_lower or word in desc_lower for word in ['cdt', 'centre for doctoral']):
-                pos['quality_score'] += 10
+            pos['quality_score'] += _phd_keyword_bonus(title, description)
 
         # Filter out very low quality positions
         if pos['quality_score'] < 25:
             low_quality_count += 1
-            print(f"   ⏭️  Low quality ({pos['quality_score']}): {pos.get('title', 'Unknown')[:40]}...")
+            _verbose(f"   ⏭️  Low quality ({pos['quality_score']}): {pos.get('title', 'Unknown')[:40]}...")
             continue
 
         validated_positions.append(pos)
 
-    # Sort by quality score
-    validated_positions.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
+    # Sort by quality score (every validated position has one by now)
+    validated_positions.sort(key=itemgetter('quality_score'), reverse=True)
 
     print(f"\n   Filtered out:")
     print(f"      • {invalid_count} invalid URLs")
@@ -912,6 +1716,129 @@ def find_all_phd_positions():
     return validated_positions
 
 
+# IMPROVED QUERIES - Target actual job postings, not search pages
+_INDUSTRY_QUERIES = (
+    # ===========================================
+    # ATS PLATFORMS (Actual job postings!)
+    # ===========================================
+    # Greenhouse - many tech/biotech companies use this
+    'site:greenhouse.io "machine learning" UK',
+    'site:greenhouse.io "data scientist" UK',
+    'site:greenhouse.io "graduate" UK',
+    'site:greenhouse.io "healthcare" UK',
+
+    # Lever - popular with startups
+    'site:lever.co "machine learning" London',
+    'site:lever.co "data" UK',
+    'site:lever.co "engineer" UK biotech',
+
+    # Workable - many companies use this
+    'site:workable.com "machine learning" UK',
+    'site:workable.com "graduate" UK',
+
+    # ===========================================
+    # SPECIFIC JOB POSTINGS (not search pages)
+    # ===========================================
+    # LinkedIn specific job views (not search results)
+    '"linkedin.com/jobs/view" "machine learning engineer" UK',
+    '"linkedin.com/jobs/view" "graduate scheme" UK',
+    '"linkedin.com/jobs/view" "data scientist" UK healthcare',
+
+    # ===========================================
+    # GRADUATE SCHEMES (High priority!)
+    # ===========================================
+    '"graduate scheme" "2025" UK technology',
+    '"graduate programme" engineering UK "apply"',
+    '"early careers" UK biotech "apply now"',
+    '"graduate rotation" UK 2025',
+
+    # ===========================================
+    # HEALTHCARE / BIOMEDICAL (User's interest)
+    # ===========================================
+    '"machine learning" healthcare UK "apply"',
+    '"data scientist" NHS UK job',
+    '"biomedical engineer" UK graduate',
+    '"medical device" engineer UK job',
+    'site:jobs.ac.uk "machine learning" -postdoc',
+    'site:jobs.ac.uk "data scientist" -postdoc -senior',
+
+    # ===========================================
+    # COMPANY CAREER PAGES (Direct postings)
+    # ===========================================
+    'site:careers.google.com "machine learning" UK',
+    'site:amazon.jobs "machine learning" UK',
+    '"careers" "machine learning engineer" UK "apply"',
+    '"careers" "graduate" biotech UK "apply"',
+
+    # ===========================================
+    # SPECIFIC COMPANIES (Hidden gems)
+    # ===========================================
+    'site:benevolent.ai careers',
+    'site:oxfordnanopore.com careers graduate',
+    'site:healx.io careers',
+    '"Cambridge Consultants" graduate careers',
+    'site:lifearc.org careers',
+)
+
+# IMPROVED QUERIES - Target actual PhD postings ({next_year} is filled in per call)
+_PHD_QUERY_TEMPLATES = (
+    # ===========================================
+    # PHD LISTING PLATFORMS (Best sources!)
+    # ===========================================
+    'site:findaphd.com "machine learning" UK funded {next_year}',
+    'site:findaphd.com "data science" UK funded',
+    'site:findaphd.com "healthcare" UK funded',
+    'site:findaphd.com "biomedical" UK funded',
+    'site:findaphd.com "computer vision" UK',
+
+    'site:jobs.ac.uk PhD "machine learning" UK -expired',
+    'site:jobs.ac.uk PhD "data science" UK',
+    'site:jobs.ac.uk PhD "healthcare" UK funded',
+    'site:jobs.ac.uk studentship "machine learning"',
+
+    # ===========================================
+    # UNIVERSITY DIRECT POSTINGS
+    # ===========================================
+    'site:cam.ac.uk PhD "machine learning" funded {next_year}',
+    'site:ox.ac.uk DPhil "machine learning" funded',
+    'site:imperial.ac.uk PhD "data science" funded',
+    'site:ucl.ac.uk PhD "machine learning" funded',
+    'site:ed.ac.uk PhD "machine learning" funded',
+    'site:kcl.ac.uk PhD "healthcare" "machine learning"',
+
+    # ===========================================
+    # CDT PROGRAMMES (Often best funded!)
+    # ===========================================
+    '"CDT" "machine learning" UK {next_year}',
+    '"Centre for Doctoral Training" AI UK apply',
+    '"EPSRC CDT" machine learning UK',
+    '"Health Data Science" CDT UK',
+
+    # ===========================================
+    # FUNDING BODIES
+    # ===========================================
+    'site:ukri.org PhD "machine learning" studentship',
+    '"EPSRC" PhD "machine learning" UK funded {next_year}',
+    '"Wellcome Trust" PhD studentship UK',
+    '"MRC" PhD "machine learning" healthcare UK',
+
+    # ===========================================
+    # RESEARCH INSTITUTES
+    # ===========================================
+    'site:turing.ac.uk PhD studentship',
+    'site:crick.ac.uk PhD studentship',
+    '"Alan Turing Institute" PhD machine learning',
+
+    # ===========================================
+    # SPECIFIC SEARCHES (Current openings)
+    # ===========================================
+    'PhD "machine learning" UK funded "deadline" {next_year}',
+    'PhD "computer vision" UK "apply by" {next_year}',
+    'PhD "healthcare AI" UK funded stipend',
+    '"fully funded PhD" "machine learning" UK {next_year}',
+)
+
+
 def search_google_industry_jobs():
     """
     Enhanced Google Search for industry jobs.
@@ -923,176 +1850,124 @@ def search_google_industry_jobs():
     4. Fetch full details for valid results
     5. Quality scoring to prioritize best matches
     """
+    all_jobs = list(_iter_google_industry_jobs())
+
+    # Sort by quality score (highest first; every kept result was scored)
+    all_jobs.sort(key=itemgetter('quality_score'), reverse=True)
+
+    return all_jobs
 
-    # IMPROVED QUERIES - Target actual job postings, not search pages
-    queries = [
-        # ===========================================
-        # ATS PLATFORMS (Actual job postings!)
-        # ===========================================
-        # Greenhouse - many tech/biotech companies use this
-        'site:greenhouse.io "machine learning" UK',
-        'site:greenhouse.io "data scientist" UK',
-        'site:greenhouse.io "graduate" UK',
-        'site:greenhouse.io "healthcare" UK',
-
-        # Lever - popular with startups
-        'site:lever.co "machine learning" London',
-        'site:lever.co "data" UK',
-        'site:lever.co "engineer" UK biotech',
-
-        # Workable - many companies use this
-        'site:workable.com "machine learning" UK',
-        'site:workable.com "graduate" UK',
-
-        # ===========================================
-        # SPECIFIC JOB POSTINGS (not search pages)
-        # ===========================================
-        # LinkedIn specific job views (not search results)
-        '"linkedin.com/jobs/view" "machine learning engineer" UK',
-        '"linkedin.com/jobs/view" "graduate scheme" UK',
-        '"linkedin.com/jobs/view" "data scientist" UK healthcare',
-
-        # ===========================================
-        # GRADUATE SCHEMES (High priority!)
-        # ===========================================
-        '"graduate scheme" "2025" UK technology',
-        '"graduate programme" engineering UK "apply"',
-        '"early careers" UK biotech "apply now"',
-        '"graduate rotation" UK 2025',
-
-        # ===========================================
-        # HEALTHCARE / BIOMEDICAL (User's interest)
-        # ===========================================
-        '"machine learning" healthcare UK "apply"',
-        '"data scientist" NHS UK job',
-        '"biomedical engineer" UK graduate',
-        '"medical device" engineer UK job',
-        'site:jobs.ac.uk "machine learning" -postdoc',
-        'site:jobs.ac.uk "data scientist" -postdoc -senior',
-
-        # ===========================================
-        # COMPANY CAREER PAGES (Direct postings)
-        # ===========================================
-        'site:careers.google.com "machine learning" UK',
-        'site:amazon.jobs "machine learning" UK',
-        '"careers" "machine learning engineer" UK "apply"',
-        '"careers" "graduate" biotech UK "apply"',
-
-        # ===========================================
-        # SPECIFIC COMPANIES (Hidden gems)
-        # ===========================================
-        'site:benevolent.ai careers',
-        'site:oxfordnanopore.com careers graduate',
-        'site:healx.io careers',
-        '"Cambridge Consultants" graduate careers',
-        'site:lifearc.org careers',
-    ]
-
-    all_jobs = []
+
+def _iter_google_industry_jobs():
+    """Yield each job search_google_industry_jobs keeps, as its query's results come in."""
+    queries = _INDUSTRY_QUERIES
+
+    kept = 0
     seen_urls = set()
 
-    for query in queries:
+    # Queries run concurrently; results come back in query order
+    for query, (items, error) in _run_google_queries(queries):
         print(f"   🔍 {query[:55]}...")
+        if error:
+            print(f"   ❌ Error: {error}")
+            continue
 
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {
-            "key": GOOGLE_API_KEY,
-            "cx": GOOGLE_CSE_ID,
-            "q": query,
-            "num": 10
-        }
-
+        candidates = []  # this query's results that pass validation and scoring
         try:
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code == 200:
-                results = response.json()
-
-                for item in results.get("items", []):
-                    item_url = item.get("link", "")
-                    item_title = item.get("title", "")
-
-                    # Skip if already seen
-                    if item_url in seen_urls:
-                        continue
-                    seen_urls.add(item_url)
-
-                    # VALIDATE: Check if this is a real job posting
-                    is_valid, reason = is_valid_job_url(item_url, item_title)
-                    if not is_valid:
-                        print(f"      ⏭️  Skipped: {reason} - {item_title[:40]}...")
-                        continue
-
-                    # Build initial job object
-                    job = {
-                        "title": item_title,
-                        "company": extract_company_from_url(item_url),
-                        "location": "UK",
-                        "city": "",
-                        "description": item.get("snippet", ""),
-                        "url": item_url,
-                        "source": "Google Search",
-                        "salary": "Not specified",
-                        "post_date": "Recent",
-                        "deadline": "Not specified",
-                        "requirements": [],
-                        "expectations": [],
-                        "cv_required": "Not specified",
-                        "cover_letter_required": "Not specified",
-                    }
-
-                    # Calculate quality score
-                    job['quality_score'] = calculate_quality_score(job)
-
-                    # Only process jobs with decent quality score
-                    if job['quality_score'] < 30:
-                        print(f"      ⏭️  Low quality ({job['quality_score']}): {item_title[:40]}...")
-                        continue
-
-                    # ENHANCE: Fetch full details for high-quality results
-                    if job['quality_score'] >= 50:
-                        try:
-                            print(f"      📄 Fetching details for: {item_title[:40]}...")
-                            full_details = fetch_job_details(item_url)
-
-                            # Merge full details with job
-                            if full_details.get('title') and len(full_details['title']) > 5:
-                                job['title'] = full_details['title']
-                            if full_details.get('company') and full_details['company'] != 'Unknown':
-                                job['company'] = full_details['company']
-                            if full_details.get('city'):
-                                job['city'] = full_details['city']
-                            if full_details.get('salary') and full_details['salary'] != 'Not specified':
-                                job['salary'] = full_details['salary']
-                            if full_details.get('deadline') and full_details['deadline'] != 'Not specified':
-                                job['deadline'] = full_details['deadline']
-                            if full_details.get('requirements'):
-                                job['requirements'] = full_details['requirements']
-                            if full_details.get('expectations'):
-                                job['expectations'] = full_details['expectations']
-                            if full_details.get('cv_required') and full_details['cv_required'] != 'Not specified':
-                                job['cv_required'] = full_details['cv_required']
-                            if full_details.get('cover_letter_required') and full_details['cover_letter_required'] != 'Not specified':
-                                job['cover_letter_required'] = full_details['cover_letter_required']
-                            if full_details.get('description'):
-                                job['description'] = full_details['description']
-
-                            print(f"      ✅ Got details: {job['company']}")
-                        except Exception as e:
-                            print(f"      ⚠️  Couldn't fetch details: {e}")
-
-                    all_jobs.append(job)
-                    print(f"      ✅ Added (score: {job['quality_score']}): {job['title'][:50]}...")
+            for item in items:
+                item_url = item.get("link", "")
+                item_title = item.get("title", "")
+
+                # Skip if already seen
+                url_key = _canonical_url(item_url)
+                if url_key in seen_urls:
+                    continue
+                seen_urls.add(url_key)
+
+                # VALIDATE: Check if this is a real job posting
+                is_valid, reason = is_valid_job_url(item_url, item_title)
+                if not is_valid:
+                    _verbose(f"      ⏭️  Skipped: {reason} - {item_title[:40]}...")
+                    continue
+
+                # Build initial job object
+                job = {
+                    "title": item_title,
+                    "company": extract_company_from_url(item_url),
+                    "location": "UK",
+                    "city": "",
+                    "description": item.get("snippet", ""),
+                    "url": item_url,
+                    "source": "Google Search",
+                    "salary": "Not specified",
+                    "post_date": "Recent",
+                    "deadline": "Not specified",
+                    "requirements": [],
+                    "expectations": [],
+                    "cv_required": "Not specified",
+                    "cover_letter_required": "Not specified",
+                }
+
+                # Calculate quality score (fields lowercased once per result)
+                job['quality_score'] = _quality_score(
+                    job,
+                    (item_title or '').lower(),
+                    (item_url or '').lower(),
+                    (job['description'] or '').lower(),
+                    job['company'].lower(),
+                )
+
+                # Only process jobs with decent quality score
+                if job['quality_score'] < 30:
+                    _verbose(f"      ⏭️  Low quality ({job['quality_score']}): {item_title[:40]}...")
+                    continue
+                candidates.append(job)
+
+            # Fetch the high-quality results' details together, then merge them in order
+            _prefetch_job_details([job['url'] for job in candidates if job['quality_score'] >= 50])
+            for job in candidates:
+                item_title = job['title']
+
+                # ENHANCE: Fetch full details for high-quality results
+                if job['quality_score'] >= 50:
+                    try:
+                        _verbose(f"      📄 Fetching details for: {item_title[:40]}...")
+                        full_details = _job_details(job['url'])
+
+                        # Merge full details with job
+                        if full_details.get('title') and len(full_details['title']) > 5:
+                            job['title'] = full_details['title']
+                        if full_details.get('company') and full_details['company'] != 'Unknown':
+                            job['company'] = full_details['company']
+                        if full_details.get('city'):
+                            job['city'] = full_details['city']
+                        if full_details.get('salary') and full_details['salary'] != 'Not specified':
+                            job['salary'] = full_details['salary']
+                        if full_details.get('deadline') and full_details['deadline'] != 'Not specified':
+                            job['deadline'] = full_details['deadline']
+                        if full_details.get('requirements'):
+                            job['requirements'] = full_details['requirements']
+                        if full_details.get('expectations'):
+                            job['expectations'] = full_details['expectations']
+                        if full_details.get('cv_required') and full_details['cv_required'] != 'Not specified':
+                            job['cv_required'] = full_details['cv_required']
+                        if full_details.get('cover_letter_required') and full_details['cover_letter_required'] != 'Not specified':
+                            job['cover_letter_required'] = full_details['cover_letter_required']
+                        if full_details.get('description'):
+                            job['description'] = full_details['description']
+
+                        _verbose(f"      ✅ Got details: {job['company']}")
+                    except Exception as e:
+                        print(f"      ⚠️  Couldn't fetch details: {e}")
+
+                kept += 1
+                _verbose(f"      ✅ Added (score: {job['quality_score']}): {job['title'][:50]}...")
+                yield job
 
         except Exception as e:
             print(f"   ❌ Error: {e}")
 
-    # Sort by quality score (highest first)
-    all_jobs.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-
-    print(f"\n   📊 Google Search: {len(all_jobs)} valid jobs (filtered from {len(seen_urls)} results)")
-
-    return all_jobs
+    print(f"\n   📊 Google Search: {kept} valid jobs (filtered from {len(seen_urls)} results)")
 
 
 def search_google_phd_positions():
@@ -1105,193 +1980,182 @@ def search_google_phd_positions():
     3. Focus on funded positions
     4. Better queries for 2025 start dates
     """
+    all_positions = list(_iter_google_phd_positions())
+
+    # Sort by quality score
+    all_positions.sort(key=itemgetter('quality_score'), reverse=True)
+
+    return all_positions
+
+
+def _iter_google_phd_positions():
+    """Yield each position search_google_phd_positions keeps, as its query's results come in."""
+    # Fill the next year into the query templates
+    next_year = datetime.now().year + 1
+    queries = [query.format(next_year=next_year) for query in _PHD_QUERY_TEMPLATES]
+    today = date.today()  # one reference day for every deadline check below
 
-    # Get current year for queries
-    current_year = datetime.now().year
-    next_year = current_year + 1
-
-    # IMPROVED QUERIES - Target actual PhD postings
-    queries = [
-        # ===========================================
-        # PHD LISTING PLATFORMS (Best sources!)
-        # ===========================================
-        f'site:findaphd.com "machine learning" UK funded {next_year}',
-        f'site:findaphd.com "data science" UK funded',
-        f'site:findaphd.com "healthcare" UK funded',
-        f'site:findaphd.com "biomedical" UK funded',
-        f'site:findaphd.com "computer vision" UK',
-
-        f'site:jobs.ac.uk PhD "machine learning" UK -expired',
-        f'site:jobs.ac.uk PhD "data science" UK',
-        f'site:jobs.ac.uk PhD "healthcare" UK funded',
-        f'site:jobs.ac.uk studentship "machine learning"',
-
-        # ===========================================
-        # UNIVERSITY DIRECT POSTINGS
-        # ===========================================
-        f'site:cam.ac.uk PhD "machine learning" funded {next_year}',
-        f'site:ox.ac.uk DPhil "machine learning" funded',
-        f'site:imperial.ac.uk PhD "data science" funded',
-        f'site:ucl.ac.uk PhD "machine learning" funded',
-        f'site:ed.ac.uk PhD "machine learning" funded',
-        f'site:kcl.ac.uk PhD "healthcare" "machine learning"',
-
-        # ===========================================
-        # CDT PROGRAMMES (Often best funded!)
-        # ===========================================
-        f'"CDT" "machine learning" UK {next_year}',
-        f'"Centre for Doctoral Training" AI UK apply',
-        f'"EPSRC CDT" machine learning UK',
-        f'"Health Data Science" CDT UK',
-
-        # ===========================================
-        # FUNDING BODIES
-        # ===========================================
-        f'site:ukri.org PhD "machine learning" studentship',
-        f'"EPSRC" PhD "machine learning" UK funded {next_year}',
-        f'"Wellcome Trust" PhD studentship UK',
-        f'"MRC" PhD "machine learning" healthcare UK',
-
-        # ===========================================
-        # RESEARCH INSTITUTES
-        # ===========================================
-        'site:turing.ac.uk PhD studentship',
-        'site:crick.ac.uk PhD studentship',
-        '"Alan Turing Institute" PhD machine learning',
-
-        # ===========================================
-        # SPECIFIC SEARCHES (Current openings)
-        # ===========================================
-        f'PhD "machine learning" UK funded "deadline" {next_year}',
-        f'PhD "computer vision" UK "apply by" {next_year}',
-        f'PhD "healthcare AI" UK funded stipend',
-        f'"fully funded PhD" "machine learning" UK {next_year}',
-    ]
-
-    all_positions = []
+    kept = 0
     seen_urls = set()
 
-    for query in queries:
+    # Queries run concurrently; results come back in query order
+    for query, (items, error) in _run_google_queries(queries):
         print(f"   🔍 {query[:55]}...")
+        if error:
+            print(f"   ❌ Error: {error}")
+            continue
 
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {
-            "key": GOOGLE_API_KEY,
-            "cx": GOOGLE_CSE_ID,
-            "q": query,
-            "num": 10
-        }
-
+        candidates = []  # this query's results that pass validation and scoring
         try:
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code == 200:
-                results = response.json()
-
-                for item in results.get("items", []):
-                    item_url = item.get("link", "")
-                    item_title = item.get("title", "")
-
-                    # Skip if already seen
-                    if item_url in seen_urls:
-                        continue
-                    seen_urls.add(item_url)
-
-                    # VALIDATE: Check if this is a real PhD posting
-                    is_valid, reason = is_valid_job_url(item_url, item_title)
-                    if not is_valid:
-                        print(f"      ⏭️  Skipped: {reason} - {item_title[:40]}...")
-                        continue
-
-                    # Build initial position object
-                    position = {
-                        "title": item_title,
-                        "company": extract_company_from_url(item_url),
-                        "location": "UK",
-                        "city": "",
-                        "description": item.get("snippet", ""),
-                        "url": item_url,
-                        "source": "Google Search",
-                        "salary": "Check listing",
-                        "post_date": "Recent",
-                        "deadline": "Not specified",
-                        "requirements": [],
-                        "expectations": [],
-                        "cv_required": "Not specified",
-                        "cover_letter_required": "Not specified",
-                        "type": "PhD",
-                    }
-
-                    # Calculate quality score
-                    position['quality_score'] = calculate_quality_score(position)
-
-                    # PhD-specific bonus points
-                    title_lower = (item_title or '').lower()
-                    desc_lower = (item.get("snippet") or '').lower()
-                    url_lower = (item_url or '').lower()
-
-                    if any(word in title_lower or word in desc_lower for word in ['funded', 'stipend', 'scholarship']):
-                        position['quality_score'] += 15
-                    if any(word in title_lower or word in desc_lower for word in ['cdt', 'centre for doctoral']):
-                        position['quality_score'] += 10
-                    if any(uni in url_lower for uni in ['cam.ac.uk', 'ox.ac.uk', 'imperial', 'ucl', 'ed.ac.uk']):
-                        position['quality_score'] += 10
-
-                    # Skip low quality
-                    if position['quality_score'] < 30:
-                        print(f"      ⏭️  Low quality ({position['quality_score']}): {item_title[:40]}...")
-                        continue
-
-                    # ENHANCE: Fetch full details for PhD positions (especially deadlines!)
-                    if position['quality_score'] >= 45:
-                        try:
-                            print(f"      📄 Fetching details for: {item_title[:40]}...")
-                            full_details = fetch_job_details(item_url)
-
-                            # Merge full details
-                            if full_details.get('title') and len(full_details['title']) > 5:
-                                position['title'] = full_details['title']
-                            if full_details.get('company') and full_details['company'] != 'Unknown':
-                                position['company'] = full_details['company']
-                            if full_details.get('city'):
-                                position['city'] = full_details['city']
-                            if full_details.get('salary') and full_details['salary'] != 'Not specified':
-                                position['salary'] = full_details['salary']
-                            if full_details.get('deadline') and full_details['deadline'] != 'Not specified':
-                                position['deadline'] = full_details['deadline']
-                            if full_details.get('requirements'):
-                                position['requirements'] = full_details['requirements']
-                            if full_details.get('description'):
-                                position['description'] = full_details['description']
-
-                            print(f"      ✅ Got details: {position['company']}")
-
-                            # CHECK DEADLINE - Filter out expired positions!
-                            if position['deadline'] and position['deadline'] != 'Not specified':
-                                is_expired, parsed_date = is_deadline_too_old(position['deadline'], max_days_past=7)
-                                if is_expired:
-                                    print(f"      ⏭️  EXPIRED ({position['deadline']}): {item_title[:40]}...")
-                                    continue
-                                elif parsed_date:
-                                    print(f"      📅 Deadline OK: {parsed_date.strftime('%d %B %Y')}")
-
-                        except Exception as e:
-                            print(f"      ⚠️  Couldn't fetch details: {e}")
-
-                    all_positions.append(position)
-                    print(f"      ✅ Added (score: {position['quality_score']}): {position['title'][:50]}...")
+            for item in items:
+                item_url = item.get("link", "")
+                item_title = item.get("title", "")
+
+                # Skip if already seen
+                url_key = _canonical_url(item_url)
+                if url_key in seen_urls:
+                    continue
+                seen_urls.add(url_key)
+
+                # VALIDATE: Check if this is a real PhD posting
+                is_valid, reason = is_valid_job_url(item_url, item_title)
+                if not is_valid:
+                    _verbose(f"      ⏭️  Skipped: {reason} - {item_title[:40]}...")
+                    continue
+
+                # Build initial position object
+                position = {
+                    "title": item_title,
+                    "company": extract_company_from_url(item_url),
+                    "location": "UK",
+                    "city": "",
+                    "description": item.get("snippet", ""),
+                    "url": item_url,
+                    "source": "Google Search",
+                    "salary": "Check listing",
+                    "post_date": "Recent",
+                    "deadline": "Not specified",
+                    "requirements": [],
+                    "expectations": [],
+                    "cv_required": "Not specified",
+                    "cover_letter_required": "Not specified",
+                    "type": "PhD",
+                }
+
+                # Calculate quality score (fields lowercased once per result)
+                title_lower = (item_title or '').lower()
+                desc_lower = (position['description'] or '').lower()
+                url_lower = (item_url or '').lower()
+                position['quality_score'] = _quality_score(
+                    position, title_lower, url_lower, desc_lower, position['company'].lower()
+                )
+
+                # PhD-specific bonus points
+                position['quality_score'] += _phd_keyword_bonus(title_lower, desc_lower)
+                if any(uni in url_lower for uni in _PHD_TOP_UNIVERSITIES):
+                    position['quality_score'] += 10
+
+                # Skip low quality
+                if position['quality_score'] < 30:
+                    _verbose(f"      ⏭️  Low quality ({position['quality_score']}): {item_title[:40]}...")
+                    continue
+
+                # A promising position whose snippet already states a deadline is
+                # settled without fetching its page: dropped if expired, otherwise
+                # kept with that deadline
+                if position['quality_score'] >= 45:
+                    snippet_deadline = _deadline_from_text(desc_lower, _KEYWORD_DEADLINE_RES)
+                    if snippet_deadline:
+                        is_expired, parsed_date = is_deadline_too_old(snippet_deadline, max_days_past=7, today=today)
+                        if is_expired:
+                            _verbose(f"      ⏭️  EXPIRED ({snippet_deadline}): {item_title[:40]}...")
+                            continue
+                        if parsed_date:
+                            # Stored as a full date rather than the lowercased snippet match
+                            position['deadline'] = parsed_date.strftime('%d %B %Y')
+                            position['_deadline_ord'] = parsed_date.toordinal()
+                candidates.append(position)
+
+            # Fetch the details of the strongest positions still without a
+            # deadline together, then merge them in order
+            _prefetch_job_details([position['url'] for position in candidates
+                                   if position['deadline'] == 'Not specified' and position['quality_score'] >= 55])
+            for position in candidates:
+                item_title = position['title']
+
+                # ENHANCE: Fetch full details for PhD positions (especially deadlines!)
+                if position['deadline'] == 'Not specified' and position['quality_score'] >= 55:
+                    try:
+                        _verbose(f"      📄 Fetching details for: {item_title[:40]}...")
+                        full_details = _job_details(position['url'])
+
+                        # Merge full details
+                        if full_details.get('title') and len(full_details['title']) > 5:
+                            position['title'] = full_details['title']
+                        if full_details.get('company') and full_details['company'] != 'Unknown':
+                            position['company'] = full_details['company']
+                        if full_details.get('city'):
+                            position['city'] = full_details['city']
+                        if full_details.get('salary') and full_details['salary'] != 'Not specified':
+                            position['salary'] = full_details['salary']
+                        if full_details.get('deadline') and full_details['deadline'] != 'Not specified':
+                            position['deadline'] = full_details['deadline']
+                        if full_details.get('requirements'):
+                            position['requirements'] = full_details['requirements']
+                        if full_details.get('description'):
+                            position['description'] = full_details['description']
+
+                        _verbose(f"      ✅ Got details: {position['company']}")
+
+                        # CHECK DEADLINE - Filter out expired positions!
+                        if position['deadline'] and position['deadline'] != 'Not specified':
+                            is_expired, parsed_date = is_deadline_too_old(position['deadline'], max_days_past=7, today=today)
+                            # Kept so find_all_phd_positions doesn't parse it again
+                            position['_deadline_ord'] = parsed_date.toordinal() if parsed_date else 0
+                            if is_expired:
+                                _verbose(f"      ⏭️  EXPIRED ({position['deadline']}): {item_title[:40]}...")
+                                continue
+                            elif parsed_date:
+                                _verbose(f"      📅 Deadline OK: {parsed_date.strftime('%d %B %Y')}")
+
+                    except Exception as e:
+                        print(f"      ⚠️  Couldn't fetch details: {e}")
+
+                kept += 1
+                _verbose(f"      ✅ Added (score: {position['quality_score']}): {position['title'][:50]}...")
+                yield position
 
         except Exception as e:
             print(f"   ❌ Error: {e}")
 
-    # Sort by quality score
-    all_positions.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-
-    print(f"\n   📊 PhD Search: {len(all_positions)} valid positions (filtered from {len(seen_urls)} results)")
-
-    return all_positions
-
-
+    print(f"\n   📊 PhD Search: {kept} valid positions (filtered from {len(seen_urls)} results)")
+
+
+# Known companies/sites, keyed by domain. Looked up against the URL's host
+# and each of its parent domains, so careers.google.com finds google.com.
+_COMPANY_BY_DOMAIN = {
+    "linkedin.com": "LinkedIn Job",
+    "indeed.co.uk": "Indeed Listing",
+    "glassdoor.co.uk": "Glassdoor Listing",
+    "deepmind.com": "Google DeepMind",
+    "google.com": "Google",
+    "microsoft.com": "Microsoft",
+    "amazon.com": "Amazon",
+    "amazon.jobs": "Amazon",
+    "meta.com": "Meta",
+    "anthropic.com": "Anthropic",
+    "openai.com": "OpenAI",
+    "jobs.ac.uk": "Jobs.ac.uk",
+    "cam.ac.uk": "University of Cambridge",
+    "ox.ac.uk": "University of Oxford",
+    "imperial.ac.uk": "Imperial College London",
+    "ucl.ac.uk": "UCL",
+    "kcl.ac.uk": "King's College London",
+    "ed.ac.uk": "University of Edinburgh",
+}
+
+
+@lru_cache(maxsize=8192)
 def extract_company_from_url(url):
     """Extract company name from URL"""
 
@@ -1299,30 +2163,11 @@ def extract_company_from_url(url):
     if not url:
         return "Unknown"
 
-    company_map = {
-        "linkedin.com": "LinkedIn Job",
-        "indeed.co.uk": "Indeed Listing",
-        "glassdoor.co.uk": "Glassdoor Listing",
-        "deepmind.com": "Google DeepMind",
-        "google.com": "Google",
-        "microsoft.com": "Microsoft",
-        "amazon": "Amazon",
-        "meta.com": "Meta",
-        "anthropic.com": "Anthropic",
-        "openai.com": "OpenAI",
-        "jobs.ac.uk": "Jobs.ac.uk",
-        "cam.ac.uk": "University of Cambridge",
-        "ox.ac.uk": "University of Oxford",
-        "imperial.ac.uk": "Imperial College London",
-        "ucl.ac.uk": "UCL",
-        "kcl.ac.uk": "King's College London",
-        "ed.ac.uk": "University of Edinburgh",
-    }
-    
-    for key, name in company_map.items():
-        if key in url.lower():
-            return name
-    
+    for host in _host_suffixes(url):
+        company = _COMPANY_BY_DOMAIN.get(host)
+        if company:
+            return company
+
     try:
         domain = url.split("//")[1].split("/")[0]
         domain = domain.replace("www.", "")
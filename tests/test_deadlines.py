@@ -0,0 +1,43 @@
+from datetime import date
+
+import pytest
+
+from scrapers import DEADLINE_UNKNOWN, parse_deadline
+
+# Reference day for yearless deadlines
+TODAY = date(2025, 8, 1)
+
+
+# Expected values match the original datetime-based parser
+@pytest.mark.parametrize("text, expected", [
+    ("2025-07-15", date(2025, 7, 15)),
+    ("Closing date: 2025-07-15", date(2025, 7, 15)),
+    ("15/07/2025", date(2025, 7, 15)),
+    ("15-07-2025", date(2025, 7, 15)),
+    ("31 December 2024", date(2024, 12, 31)),
+    ("31 Dec 2024", date(2024, 12, 31)),
+    ("December 31, 2024", date(2024, 12, 31)),
+    ("Applications close December 31 2024", date(2024, 12, 31)),
+    ("15 July", date(2026, 7, 15)),
+    ("31 December", date(2025, 12, 31)),
+    ("interviews from 3 jan, closing jan 15, 2025", date(2025, 1, 15)),
+])
+def test_parse_deadline(text, expected):
+    assert parse_deadline(text, today=TODAY) == expected
+
+
+def test_parse_deadline_month_day_when_day_over_12():
+    # The original parser rejected this; it now falls back to MM/DD
+    assert parse_deadline("07/15/2025", today=TODAY) == date(2025, 7, 15)
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Not specified",
+    "N/A",
+    "rolling",
+    "Rolling basis",
+    "31/02/2025",
+])
+def test_parse_deadline_unknown(text):
+    assert parse_deadline(text, today=TODAY) is DEADLINE_UNKNOWN
@@ -0,0 +1,25 @@
+import scrapers
+
+
+def test_save_cache_round_trips_through_jsonl(tmp_path, monkeypatch):
+    monkeypatch.setattr(scrapers, "CACHE_FILE", str(tmp_path / "cache.jsonl"))
+    monkeypatch.setattr(scrapers, "CACHE_META_FILE", str(tmp_path / "cache.meta.json"))
+    jobs = [{"url": "https://example.com/jobs/1", "title": "A"},
+            {"url": "https://example.com/jobs/2", "title": "B"}]
+
+    scrapers.save_cache(jobs, search_type="phd")
+
+    assert scrapers.load_cache(search_type="phd") == jobs
+    assert scrapers.load_cache(search_type="industry") is None
+
+
+def test_load_cache_stops_at_partial_last_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(scrapers, "CACHE_FILE", str(tmp_path / "cache.jsonl"))
+    monkeypatch.setattr(scrapers, "CACHE_META_FILE", str(tmp_path / "cache.meta.json"))
+
+    scrapers.start_cache("industry")
+    scrapers.append_cache({"url": "https://example.com/jobs/1"})
+    with open(scrapers.CACHE_FILE, "a") as f:
+        f.write('{"url": "https://exa')
+
+    assert scrapers.load_cache("industry") == [{"url": "https://example.com/jobs/1"}]
@@ -0,0 +1,42 @@
+from openpyxl import load_workbook
+
+from tracker import EnhancedJobTracker
+
+
+def _job(n):
+    return {
+        "url": f"https://example.com/jobs/{n}",
+        "title": f"Research Scientist {n}",
+        "company": f"Company {n}",
+        "location": "Cambridge",
+    }
+
+
+def test_reexport_updates_rows_in_place(tmp_path):
+    tracker = EnhancedJobTracker(str(tmp_path / "tracker.json"))
+    tracker.add_job(_job(1))
+    tracker.add_job(_job(2))
+    xlsx = str(tmp_path / "jobs.xlsx")
+
+    tracker.export_to_excel_fancy(xlsx)
+    assert load_workbook(xlsx).active.max_row == 3
+
+    # Re-exporting the same jobs must not append duplicate rows
+    tracker.export_to_excel_fancy(xlsx)
+    assert load_workbook(xlsx).active.max_row == 3
+
+    # A status change rewrites the existing row's status cell
+    tracker.update_status(_job(1)["url"], "interview")
+    tracker.export_to_excel_fancy(xlsx)
+    ws = load_workbook(xlsx).active
+    assert ws.max_row == 3
+    assert ws["B2"].value == "Interview Scheduled"
+    assert ws["B3"].value == "Have Not Applied"
+
+    # Only genuinely new jobs are appended
+    tracker.add_job(_job(3))
+    tracker.export_to_excel_fancy(xlsx)
+    tracker.export_to_excel_fancy(xlsx)
+    ws = load_workbook(xlsx).active
+    assert ws.max_row == 4
+    assert ws["C4"].value == "Research Scientist 3"
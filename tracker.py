@@ -11,15 +11,99 @@ import json
 import os
 from datetime import datetime
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.hyperlink import Hyperlink
 from openpyxl.utils import get_column_letter
 
+# Style objects shared by every cell that uses them. openpyxl registers a
+# cell's style on each assignment, so one object beats a fresh one per cell
+_WRAP_ALIGNMENT = Alignment(vertical="center", wrap_text=True)
+_CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_THIN_BORDER = Border(
+    left=Side(style='thin', color='CCCCCC'),
+    right=Side(style='thin', color='CCCCCC'),
+    top=Side(style='thin', color='CCCCCC'),
+    bottom=Side(style='thin', color='CCCCCC')
+)
+_HEADER_FILL = PatternFill(start_color="2E5E3E", end_color="2E5E3E", fill_type="solid")  # Dark green (matching Google Sheets screenshot)
+_HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+_ROW_FILL = PatternFill(start_color="E8F5E9", end_color="E8F5E9", fill_type="solid")  # Light green
+_LINK_FONT = Font(color="0563C1", underline="single")  # Blue underlined link
+_BADGE_FONT = Font(bold=True, color="FFFFFF")  # White text on the status/rejection colors
+
+# Status colors matching Google Sheets screenshot
+_STATUS_COLORS = {
+    "Submitted - Pending Response": "4CAF50",  # Green
+    "Have Not Applied": "64B5F6",              # Blue
+    "Interview Scheduled": "81C784",           # Light green
+    "Offer Received": "2E7D32",                # Dark green
+    "Rejected": "E57373",                      # Red
+    "N/A": "9E9E9E",                           # Grey
+}
+_STATUS_FILLS = {
+    status: PatternFill(start_color=color, end_color=color, fill_type="solid")
+    for status, color in _STATUS_COLORS.items()
+}
+
+# Column widths matching the Google Sheets layout
+_COLUMN_WIDTHS = {
+    "A": 25,   # Company Name
+    "B": 28,   # Application Status
+    "C": 45,   # Role
+    "D": 18,   # Salary
+    "E": 14,   # Date Submitted
+    "F": 40,   # Link to Job Req
+    "G": 18,   # Rejection Reason
+    "H": 20,   # Location
+    "I": 14,   # Deadline
+    "J": 30,   # Notes
+    "K": 50,   # AI Summary
+}
+
+# Map internal status to display status. New rows only tell "applied" from
+# not applied; updates show the full progress
+_NEW_ROW_STATUS = {
+    "new": "Have Not Applied",
+    "liked": "Have Not Applied",
+    "maybe": "Have Not Applied",
+    "disliked": "Have Not Applied",
+    "applied": "Submitted - Pending Response",
+    "interview": "Submitted - Pending Response",
+    "offer": "Submitted - Pending Response",
+    "rejected": "Submitted - Pending Response"
+}
+_DISPLAY_STATUS = {
+    "new": "Have Not Applied",
+    "liked": "Have Not Applied",
+    "maybe": "Have Not Applied",
+    "disliked": "Have Not Applied",
+    "applied": "Submitted - Pending Response",
+    "interview": "Interview Scheduled",
+    "offer": "Offer Received",
+    "rejected": "Rejected"
+}
+
 
 class EnhancedJobTracker:
     """Enhanced job tracker with detailed information and fancy Excel export"""
 
+    # Columns matching the user's Google Sheets format
+    HEADERS = [
+        "Company Name",        # A
+        "Application Status",  # B - with dropdown
+        "Role",                # C
+        "Salary",              # D
+        "Date Submitted",      # E
+        "Link to Job Req",     # F - URL/PDF link
+        "Rejection Reason",    # G - with dropdown
+        "Location",            # H
+        "Deadline",            # I
+        "Notes",               # J
+        "AI Summary",          # K
+    ]
+
     def __init__(self, filename="job_tracker.json"):
         self.filename = filename
         self.jobs = self.load()
@@ -33,8 +117,12 @@ class EnhancedJobTracker:
     
     def save(self):
         """Save jobs to JSON"""
-        with open(self.filename, "w") as f:
-            json.dump(self.jobs, f, indent=2)
+        # Compact output (the file is rewritten on every change), written to a
+        # temp file and swapped in so a crash mid-write can't truncate it
+        tmp_file = self.filename + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(self.jobs, f, separators=(",", ":"))
+        os.replace(tmp_file, self.filename)
     
     def add_job(self, job, status="new"):
         """Add a job with all details"""
@@ -104,120 +192,112 @@ class EnhancedJobTracker:
             wb = load_workbook(filename)
             ws = wb.active
 
-            # Get existing URLs to avoid duplicates
-            existing_urls = set()
+            # Map existing URLs to their rows in one pass, to avoid duplicates.
+            # Rows written here display "View Job" and keep the URL as the
+            # cell's hyperlink
+            url_to_row = {}
             for row in range(2, ws.max_row + 1):
-                url = ws.cell(row=row, column=URL_COLUMN).value
+                cell = ws.cell(row=row, column=URL_COLUMN)
+                url = cell.hyperlink.target if cell.hyperlink else cell.value
                 if url:
-                    existing_urls.add(url)
+                    url_to_row.setdefault(url, row)
 
             # Add only new jobs
             row_num = ws.max_row + 1
             new_count = 0
+            updated_count = 0
 
             for url, job in self.jobs.items():
-                if url not in existing_urls:
+                row = url_to_row.get(url)
+                if row is None:
                     self._add_job_row_fancy(ws, row_num, job)
                     row_num += 1
                     new_count += 1
                 else:
                     # Update status if changed
-                    for row in range(2, ws.max_row + 1):
-                        if ws.cell(row=row, column=URL_COLUMN).value == url:
-                            self._update_status_cell(ws, row, job["status"])
-                            break
+                    if self._update_status_cell(ws, row, job["status"]):
+                        updated_count += 1
+
+            # Nothing to write back: skip re-saving the whole workbook
+            if not new_count and not updated_count:
+                print("   ✅ Already up to date")
+                return filename
 
             print(f"   ✅ Added {new_count} new jobs")
-            print(f"   ✅ Updated statuses for existing jobs")
+            print(f"   ✅ Updated {updated_count} statuses for existing jobs")
+
+            # Add dropdowns and formatting
+            self._add_fancy_dropdowns(ws, ws.max_row)
+            self._auto_fit_columns(ws)
+
+            # Save
+            wb.save(filename)
         
         else:
             print(f"📊 Creating new spreadsheet: {filename}")
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Job Applications"
-            
-            # Create header row
-            self._create_fancy_header(ws)
-            
-            # Add all jobs
-            row_num = 2
-            for url, job in self.jobs.items():
-                self._add_job_row_fancy(ws, row_num, job)
-                row_num += 1
-            
+            self._create_new_writeonly(filename)
             print(f"   ✅ Added {len(self.jobs)} jobs")
-        
-        # Add dropdowns and formatting
-        self._add_fancy_dropdowns(ws)
-        self._auto_fit_columns(ws)
-        
-        # Save
-        wb.save(filename)
+
         print(f"✅ Spreadsheet saved: {filename}\n")
         
         return filename
     
+    def _create_new_writeonly(self, filename):
+        """
+        Write a new spreadsheet in openpyxl's write-only mode, which streams
+        each row to disk instead of keeping every cell in memory
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Job Applications")
+
+        # Column widths, the header height and the filter are written ahead
+        # of the rows, so they have to be set first
+        self._auto_fit_columns(ws)
+        header = [WriteOnlyCell(ws) for _ in range(len(self.HEADERS))]
+        self._fill_fancy_header(ws, header)
+        ws.append(header)
+
+        # Add all jobs
+        row_num = 2
+        for url, job in self.jobs.items():
+            cells = [WriteOnlyCell(ws) for _ in range(len(self.HEADERS))]
+            self._fill_job_row_fancy(cells, row_num, job)
+            ws.append(cells)
+            row_num += 1
+
+        self._add_fancy_dropdowns(ws, row_num - 1)
+        wb.save(filename)
+
     def _create_fancy_header(self, ws):
         """Create Google Sheets-style header with dark green background"""
+        cells = [ws.cell(row=1, column=col_num) for col_num in range(1, len(self.HEADERS) + 1)]
+        self._fill_fancy_header(ws, cells)
 
-        # Columns matching the user's Google Sheets format
-        headers = [
-            "Company Name",        # A
-            "Application Status",  # B - with dropdown
-            "Role",                # C
-            "Salary",              # D
-            "Date Submitted",      # E
-            "Link to Job Req",     # F - URL/PDF link
-            "Rejection Reason",    # G - with dropdown
-            "Location",            # H
-            "Deadline",            # I
-            "Notes",               # J
-            "AI Summary",          # K
-        ]
+    def _fill_fancy_header(self, ws, cells):
+        """Set the header values and styles on cells (regular or write-only)"""
 
-        # Dark green header (matching Google Sheets screenshot)
-        header_fill = PatternFill(start_color="2E5E3E", end_color="2E5E3E", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        # Thin border for header
-        thin_border = Border(
-            left=Side(style='thin', color='CCCCCC'),
-            right=Side(style='thin', color='CCCCCC'),
-            top=Side(style='thin', color='CCCCCC'),
-            bottom=Side(style='thin', color='CCCCCC')
-        )
-
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
+        for cell, header in zip(cells, self.HEADERS):
             cell.value = header
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-            cell.border = thin_border
+            cell.fill = _HEADER_FILL
+            cell.font = _HEADER_FONT
+            cell.alignment = _CENTER_ALIGNMENT
+            cell.border = _THIN_BORDER
 
         # Set row height
         ws.row_dimensions[1].height = 30
 
         # Enable auto-filter (creates the filter dropdown arrows)
-        ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}1"
+        ws.auto_filter.ref = f"A1:{get_column_letter(len(self.HEADERS))}1"
     
     def _add_job_row_fancy(self, ws, row_num, job):
         """Add a job row matching Google Sheets format"""
+        cells = [ws.cell(row=row_num, column=col_num) for col_num in range(1, len(self.HEADERS) + 1)]
+        self._fill_job_row_fancy(cells, row_num, job)
 
-        # Map internal status to display status
-        status_map = {
-            "new": "Have Not Applied",
-            "liked": "Have Not Applied",
-            "maybe": "Have Not Applied",
-            "disliked": "Have Not Applied",
-            "applied": "Submitted - Pending Response",
-            "interview": "Submitted - Pending Response",
-            "offer": "Submitted - Pending Response",
-            "rejected": "Submitted - Pending Response"
-        }
+    def _fill_job_row_fancy(self, cells, row_num, job):
+        """Set a job's values and styles on one row of cells (regular or write-only)"""
 
-        application_status = status_map.get(job.get("status", "new"), "Have Not Applied")
+        application_status = _NEW_ROW_STATUS.get(job.get("status", "new"), "Have Not Applied")
 
         # If actually applied, use the applied date, otherwise use date found
         date_submitted = job.get("applied_date") or job.get("date_found", "")
@@ -242,103 +322,77 @@ class EnhancedJobTracker:
             job.get("ai_summary", ""),               # K: AI Summary
         ]
 
-        # Thin border style
-        thin_border = Border(
-            left=Side(style='thin', color='CCCCCC'),
-            right=Side(style='thin', color='CCCCCC'),
-            top=Side(style='thin', color='CCCCCC'),
-            bottom=Side(style='thin', color='CCCCCC')
-        )
-
         # Add data to row
-        for col_num, value in enumerate(row_data, 1):
-            cell = ws.cell(row=row_num, column=col_num)
+        for cell, value in zip(cells, row_data):
             cell.value = value
-            cell.alignment = Alignment(vertical="center", wrap_text=True)
-            cell.border = thin_border
+            cell.alignment = _WRAP_ALIGNMENT
+            cell.border = _THIN_BORDER
 
         # Make URL clickable (column F = column 6)
         url = job.get("url", "")
         if url:
-            url_cell = ws.cell(row=row_num, column=6)
+            url_cell = cells[5]
             url_cell.hyperlink = url
             url_cell.value = "View Job"  # Display text instead of full URL
-            url_cell.font = Font(color="0563C1", underline="single")  # Blue underlined link
+            url_cell.font = _LINK_FONT  # Blue underlined link
 
         # Apply alternating row colors (light green / white)
         if row_num % 2 == 0:
-            row_fill = PatternFill(start_color="E8F5E9", end_color="E8F5E9", fill_type="solid")
-            for col_num in range(1, len(row_data) + 1):
-                ws.cell(row=row_num, column=col_num).fill = row_fill
+            for cell in cells:
+                cell.fill = _ROW_FILL
             # Keep link blue even on green rows
             if url:
-                ws.cell(row=row_num, column=6).font = Font(color="0563C1", underline="single")
+                cells[5].font = _LINK_FONT
 
         # Color-code status cell (column B)
-        self._color_status_cell(ws, row_num, application_status)
+        self._color_status(cells[1], application_status)
 
         # Color-code rejection reason cell (column G)
-        self._color_rejection_cell(ws, row_num, "N/A")
-    
+        self._color_rejection(cells[6], "N/A")
+
     def _color_status_cell(self, ws, row_num, status):
         """Apply color to status cell based on status (Google Sheets style)"""
+        self._color_status(ws.cell(row=row_num, column=2), status)  # Status column B
 
-        # Colors matching Google Sheets screenshot
-        status_colors = {
-            "Submitted - Pending Response": "4CAF50",  # Green
-            "Have Not Applied": "64B5F6",              # Blue
-            "Interview Scheduled": "81C784",           # Light green
-            "Offer Received": "2E7D32",                # Dark green
-            "Rejected": "E57373",                      # Red
-            "N/A": "9E9E9E",                           # Grey
-        }
-
-        color = status_colors.get(status, "9E9E9E")
-        cell = ws.cell(row=row_num, column=2)  # Status column B
-        cell.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
-        cell.font = Font(bold=True, color="FFFFFF")  # White text
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    def _color_status(self, cell, status):
+        """Apply a status's color to a cell"""
+
+        cell.fill = _STATUS_FILLS.get(status, _STATUS_FILLS["N/A"])  # Grey if unknown
+        cell.font = _BADGE_FONT
+        cell.alignment = _CENTER_ALIGNMENT
 
     def _color_rejection_cell(self, ws, row_num, reason):
         """Apply color to rejection reason cell (Google Sheets style)"""
+        self._color_rejection(ws.cell(row=row_num, column=7), reason)  # Rejection Reason column G
+
+    def _color_rejection(self, cell, reason):
+        """Apply a rejection reason's color to a cell"""
 
         # Grey background for N/A, red for actual rejections
         if reason == "N/A" or not reason:
-            color = "9E9E9E"  # Grey
+            cell.fill = _STATUS_FILLS["N/A"]  # Grey
         else:
-            color = "E57373"  # Red
-
-        cell = ws.cell(row=row_num, column=7)  # Rejection Reason column G
-        cell.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+            cell.fill = _STATUS_FILLS["Rejected"]  # Red
+        cell.font = _BADGE_FONT
+        cell.alignment = _CENTER_ALIGNMENT
     
     def _update_status_cell(self, ws, row_num, status):
-        """Update status cell with new status and color"""
-
-        # Map internal status to display status
-        status_map = {
-            "new": "Have Not Applied",
-            "liked": "Have Not Applied",
-            "maybe": "Have Not Applied",
-            "disliked": "Have Not Applied",
-            "applied": "Submitted - Pending Response",
-            "interview": "Interview Scheduled",
-            "offer": "Offer Received",
-            "rejected": "Rejected"
-        }
-
-        display_status = status_map.get(status, "Have Not Applied")
+        """Update status cell with new status and color; returns whether the status changed"""
+
+        display_status = _DISPLAY_STATUS.get(status, "Have Not Applied")
         cell = ws.cell(row=row_num, column=2)
+        if cell.value == display_status:
+            return False  # Already shown with this status and its color
         cell.value = display_status
 
         # Update color
         self._color_status_cell(ws, row_num, display_status)
+        return True
     
-    def _add_fancy_dropdowns(self, ws):
+    def _add_fancy_dropdowns(self, ws, last_row):
         """Add dropdowns matching Google Sheets format"""
 
-        max_row = max(ws.max_row, 100)  # Extend dropdowns for future entries
+        max_row = max(last_row, 100)  # Extend dropdowns for future entries
 
         # Application Status dropdown (column B)
         status_options = '"Submitted - Pending Response,Have Not Applied,Interview Scheduled,Offer Received,Rejected,N/A"'
@@ -347,7 +401,7 @@ class EnhancedJobTracker:
         status_dv.errorTitle = "Invalid Status"
         status_dv.prompt = "Select application status"
         status_dv.promptTitle = "Application Status"
-        ws.add_data_validation(status_dv)
+        ws.data_validations.append(status_dv)  # what add_data_validation does; write-only sheets lack it
         status_dv.add(f"B2:B{max_row}")
 
         # Rejection Reason dropdown (column G)
@@ -357,27 +411,12 @@ class EnhancedJobTracker:
         rejection_dv.errorTitle = "Invalid Reason"
         rejection_dv.prompt = "Select rejection reason (if applicable)"
         rejection_dv.promptTitle = "Rejection Reason"
-        ws.add_data_validation(rejection_dv)
+        ws.data_validations.append(rejection_dv)
         rejection_dv.add(f"G2:G{max_row}")
     
     def _auto_fit_columns(self, ws):
         """Auto-fit column widths matching Google Sheets layout"""
-
-        column_widths = {
-            "A": 25,   # Company Name
-            "B": 28,   # Application Status
-            "C": 45,   # Role
-            "D": 18,   # Salary
-            "E": 14,   # Date Submitted
-            "F": 40,   # Link to Job Req
-            "G": 18,   # Rejection Reason
-            "H": 20,   # Location
-            "I": 14,   # Deadline
-            "J": 30,   # Notes
-            "K": 50,   # AI Summary
-        }
-
-        for col, width in column_widths.items():
+        for col, width in _COLUMN_WIDTHS.items():
             ws.column_dimensions[col].width = width
 
 